@@ -29,6 +29,7 @@ import numbers
 import re
 import sys
 import json
+import tempfile
 try:
         import ConfigParser
 except ImportError:
@@ -41,15 +42,22 @@ try:
 except ImportError:
     from io import BytesIO
 
+from azureml.cache import (
+    DatasetCache,
+    _Catalog,
+    _MetadataCache,
+)
 from azureml.errors import (
     AzureMLConflictHttpError,
     AzureMLError,
     AzureMLHttpError,
+    AzureMLTransientHttpError,
     UnsupportedDatasetTypeError,
     _not_none,
     _not_none_or_empty,
 )
 from azureml.http import (
+    RetryPolicy,
     _RestClient,
     __author__,
     __version__,
@@ -114,25 +122,104 @@ class SourceDataset(Dataset):
     def __repr__(self):
         return SourceDataset._metadata_repr(self._metadata)
 
-    def open(self):
-        '''Open and return a stream for the dataset contents.'''
-        return self.workspace._rest.open_dataset_contents(self.contents_url)
-
-    def read_as_binary(self):
-        '''Read and return the dataset contents as binary.'''
-        return self.workspace._rest.read_dataset_contents_binary(self.contents_url)
+    def open(self, max_connections=None):
+        '''
+        Open and return a stream for the dataset contents.
+
+        Large datasets are downloaded as several byte ranges in parallel,
+        over up to max_connections connections. Use max_connections=1 to
+        always download over a single connection.
+        '''
+        cached = self._open_cached(max_connections)
+        if cached is not None:
+            return cached
+
+        return self.workspace._rest.open_dataset_contents(
+            self.contents_url, self._metadata.get('Size'), max_connections)
+
+    def read_as_binary(self, max_connections=None):
+        '''
+        Read and return the dataset contents as binary.
+
+        Large datasets are downloaded as several byte ranges in parallel,
+        over up to max_connections connections. Use max_connections=1 to
+        always download over a single connection.
+        '''
+        cached = self._open_cached(max_connections)
+        if cached is not None:
+            with cached:
+                return cached.read()
+
+        return self.workspace._rest.read_dataset_contents_binary(
+            self.contents_url, self._metadata.get('Size'), max_connections)
 
     def read_as_text(self):
         '''Read and return the dataset contents as text.'''
+        cached = self._open_cached(None)
+        if cached is not None:
+            with cached:
+                return cached.read().decode('utf-8')
+
         return self.workspace._rest.read_dataset_contents_text(self.contents_url)
 
-    def _to_dataframe(self):
-        """Read and return the dataset contents as a pandas DataFrame."""
-        with self.open() as reader:
-            return deserialize_dataframe(reader, self.data_type_id)
+    def _open_cached(self, max_connections):
+        '''
+        Open and return the dataset contents from the workspace cache, first
+        downloading them to the cache on a miss. Returns None if the
+        workspace has no cache or the dataset is larger than the cache.
+        '''
+        cache = self.workspace.cache
+        size = self._metadata.get('Size')
+        if cache is None or size is None or size > cache.max_size:
+            return None
+
+        key = u'{0}:{1}:{2}'.format(
+            self.dataset_id, size, self._metadata.get('CreatedDateTicks'))
+        cached = cache.open(key)
+        if cached is None:
+            with self.workspace._rest.open_dataset_contents(
+                    self.contents_url, size, max_connections) as reader:
+                cached = cache.add(key, reader, size)
+        return cached
+
+    def _to_dataframe(self, max_connections=None, chunksize=None,
+                      columns=None, dtypes=None, engine=None):
+        """
+        Read and return the dataset contents as a pandas DataFrame.
+
+        Large datasets are downloaded as several byte ranges in parallel,
+        over up to max_connections connections.
+
+        If chunksize is specified, return an iterator of DataFrames of up to
+        chunksize rows instead. The contents are parsed as they are
+        downloaded, so memory use depends on chunksize rather than on the
+        size of the dataset.
+
+        Specify columns to parse only these columns, and dtypes to set the
+        data types of columns instead of inferring them. Specify
+        engine='parallel' to parse csv and tsv contents on several threads.
+        See azureml.deserialize_dataframe.
+        """
+        if chunksize is not None:
+            return self._iter_dataframes(
+                max_connections, chunksize, columns, dtypes, engine)
+
+        with self.open(max_connections) as reader:
+            return deserialize_dataframe(
+                reader, self.data_type_id, columns=columns, dtypes=dtypes,
+                engine=engine)
+
+    def _iter_dataframes(self, max_connections, chunksize, columns, dtypes,
+                         engine):
+        with self.open(max_connections) as reader:
+            for dataframe in deserialize_dataframe(
+                    reader, self.data_type_id, chunksize=chunksize,
+                    columns=columns, dtypes=dtypes, engine=engine):
+                yield dataframe
 
     def _update_from_dataframe(self, dataframe, data_type_id=None, name=None,
-                              description=None):
+                              description=None, max_concurrency=1,
+                              max_workers=None):
         """
         Serialize the specified DataFrame and replace the existing dataset.
 
@@ -149,6 +236,7 @@ class SourceDataset(Dataset):
                 'GenericTSV'
                 'GenericCSVNoHeader'
                 'GenericTSVNoHeader'
+                'ARFF'
             See the azureml.DataTypeIds class for constants.
         name : str, optional
             Name for the dataset.
@@ -156,6 +244,12 @@ class SourceDataset(Dataset):
         description : str, optional
             Description for the dataset.
             If None, the name of the existing dataset is used.
+        max_concurrency : int, optional
+            Maximum number of blocks of data uploaded in parallel. The
+            pool_maxsize of the workspace should be at least as large.
+        max_workers : int, optional
+            Number of processes serializing large dataframes to csv or tsv.
+            See azureml.serialize_dataframe.
         """
         _not_none('dataframe', dataframe)
 
@@ -166,24 +260,34 @@ class SourceDataset(Dataset):
         if description is None:
             description = self.description
 
-        try:
-            output = BytesIO()
-            serialize_dataframe(output, data_type_id, dataframe)
-            raw_data = output.getvalue()
-        finally:
-            output.close()
-
-        self._upload_and_refresh(raw_data, data_type_id, name, description)
+        # the data is serialized to a temporary file, which is uploaded a
+        # block at a time from a memory map
+        with tempfile.TemporaryFile() as spool:
+            serialize_dataframe(spool, data_type_id, dataframe,
+                                max_workers=max_workers)
+            spool.flush()
+            dataset_id = self.workspace._rest.upload_dataset_from_file(
+                self.workspace.workspace_id,
+                name,
+                description,
+                data_type_id,
+                spool,
+                self.family_id,
+                max_concurrency=max_concurrency,
+            )
+        self._refresh_uploaded(dataset_id)
 
     def _update_from_raw_data(self, raw_data, data_type_id=None, name=None,
-                             description=None):
+                             description=None, max_concurrency=1):
         """
         Upload already serialized raw data and replace the existing dataset.
 
         Parameters
         ----------
-        raw_data: bytes
-            Dataset contents to upload.
+        raw_data: bytes or str
+            Dataset contents to upload. Any object supporting the buffer
+            protocol, such as bytearray, memoryview or mmap, is uploaded
+            without being copied. A str is uploaded encoded as UTF-8.
         data_type_id : str
             Serialization format of the raw data.
             If None, the format of the existing dataset is used.
@@ -201,6 +305,9 @@ class SourceDataset(Dataset):
         description : str, optional
             Description for the dataset.
             If None, the name of the existing dataset is used.
+        max_concurrency : int, optional
+            Maximum number of blocks of data uploaded in parallel. The
+            pool_maxsize of the workspace should be at least as large.
         """
         _not_none('raw_data', raw_data)
 
@@ -211,17 +318,24 @@ class SourceDataset(Dataset):
         if description is None:
             description = self.description
 
-        self._upload_and_refresh(raw_data, data_type_id, name, description)
+        self._upload_and_refresh(raw_data, data_type_id, name, description,
+                                 max_concurrency)
 
-    def _upload_and_refresh(self, raw_data, data_type_id, name, description):
+    def _upload_and_refresh(self, raw_data, data_type_id, name, description,
+                            max_concurrency):
         dataset_id = self.workspace._rest.upload_dataset(
             self.workspace.workspace_id,
             name,
             description,
             data_type_id,
             raw_data,
-            self.family_id
+            self.family_id,
+            max_concurrency=max_concurrency,
         )
+        self._refresh_uploaded(dataset_id)
+
+    def _refresh_uploaded(self, dataset_id):
+        self.workspace._datasets_listing.invalidate()
 
         self._metadata = self.workspace._rest.get_dataset(
             self.workspace.workspace_id,
@@ -446,23 +560,108 @@ class Datasets(object):
             yield self._create_dataset(dataset)
 
     def __len__(self):
-        return sum(1 for _ in self._get_datasets())
+        return len(self._get_datasets())
 
     def __getitem__(self, index):
         '''Retrieve a dataset by index or by name (case-sensitive).'''
         _not_none('index', index)
 
-        datasets = self._get_datasets()
         if isinstance(index, numbers.Integral):
-            return self._create_dataset(list(datasets)[index])
+            return self._create_dataset(self._get_datasets()[index])
+        else:
+            return self._get_by_name(self._get_catalog(), index)
+
+    def get_many(self, names):
+        """
+        Retrieve several datasets by name (case-sensitive), from a single
+        listing of the workspace.
+
+        Parameters
+        ----------
+        names : iterable of str
+            Names of the datasets.
+
+        Returns
+        -------
+        list of SourceDataset, in the order of the names.
+        """
+        _not_none('names', names)
+
+        catalog = self._get_catalog()
+        return [self._get_by_name(catalog, name) for name in names]
+
+    def get_by_id(self, dataset_id):
+        """
+        Retrieve a dataset by id, with a single request instead of a listing
+        of the workspace.
+
+        Parameters
+        ----------
+        dataset_id : str
+            Unique identifier of the dataset.
+        """
+        _not_none_or_empty('dataset_id', dataset_id)
+
+        return self.get_many_by_id([dataset_id], max_connections=1)[0]
+
+    def get_many_by_id(self, dataset_ids, max_connections=None):
+        """
+        Retrieve several datasets by id, with one request per dataset sent
+        in parallel, instead of a listing of the workspace.
+
+        Parameters
+        ----------
+        dataset_ids : iterable of str
+            Unique identifiers of the datasets.
+        max_connections : int, optional
+            Maximum number of requests in flight. The pool_maxsize of the
+            workspace should be at least as large.
+
+        Returns
+        -------
+        list of SourceDataset, in the order of the ids.
+        """
+        _not_none('dataset_ids', dataset_ids)
+
+        dataset_ids = list(dataset_ids)
+        datasets = self.workspace._rest.get_datasets_by_id(
+            self.workspace.workspace_id, dataset_ids, max_connections)
+        for dataset_id, dataset in zip(dataset_ids, datasets):
+            if dataset is None or not self._filter([dataset]):
+                raise IndexError('A data set with the id "{}" does not exist'.format(dataset_id))
+
+        return [self._create_dataset(dataset) for dataset in datasets]
+
+    def find(self, data_type_id=None, family_id=None):
+        """
+        Retrieve the datasets with the specified format and/or family.
+
+        Parameters
+        ----------
+        data_type_id : str, optional
+            Serialization format of the datasets.
+            See the azureml.DataTypeIds class for constants.
+        family_id : str, optional
+            Family of the datasets, shared by all the versions of a dataset.
+
+        Returns
+        -------
+        list of SourceDataset, in listing order.
+        """
+        catalog = self._get_catalog()
+        if family_id is not None:
+            datasets = self._filter(catalog.find('FamilyId', family_id))
+            if data_type_id is not None:
+                datasets = [d for d in datasets if d['DataTypeId'] == data_type_id]
+        elif data_type_id is not None:
+            datasets = self._filter(catalog.find('DataTypeId', data_type_id))
         else:
-            for dataset in datasets:
-                if dataset['Name'] == index:
-                    return self._create_dataset(dataset)
+            datasets = self._get_datasets(catalog)
 
-        raise IndexError('A data set named "{}" does not exist'.format(index))
+        return [self._create_dataset(dataset) for dataset in datasets]
 
-    def add_from_dataframe(self, dataframe, data_type_id, name, description):
+    def add_from_dataframe(self, dataframe, data_type_id, name, description,
+                           max_concurrency=1, max_workers=None):
         """
         Serialize the specified DataFrame and upload it as a new dataset.
 
@@ -478,11 +677,18 @@ class Datasets(object):
                 'GenericTSV'
                 'GenericCSVNoHeader'
                 'GenericTSVNoHeader'
+                'ARFF'
             See the azureml.DataTypeIds class for constants.
         name : str
             Name for the new dataset.
         description : str
             Description for the new dataset.
+        max_concurrency : int, optional
+            Maximum number of blocks of data uploaded in parallel. The
+            pool_maxsize of the workspace should be at least as large.
+        max_workers : int, optional
+            Number of processes serializing large dataframes to csv or tsv.
+            See azureml.serialize_dataframe.
 
         Returns
         -------
@@ -497,23 +703,29 @@ class Datasets(object):
         _not_none_or_empty('name', name)
         _not_none_or_empty('description', description)
 
-        try:
-            output = BytesIO()
-            serialize_dataframe(output, data_type_id, dataframe)
-            raw_data = output.getvalue()
-        finally:
-            output.close()
+        # the data is serialized to a temporary file, which is uploaded a
+        # block at a time from a memory map
+        with tempfile.TemporaryFile() as spool:
+            serialize_dataframe(spool, data_type_id, dataframe,
+                                max_workers=max_workers)
+            spool.flush()
+            dataset_id = self.workspace._rest.upload_dataset_from_file(
+                self.workspace.workspace_id, name, description, data_type_id,
+                spool, None, max_concurrency=max_concurrency)
 
-        return self._upload(raw_data, data_type_id, name, description)
+        return self._get_uploaded_dataset(dataset_id)
 
-    def add_from_raw_data(self, raw_data, data_type_id, name, description):
+    def add_from_raw_data(self, raw_data, data_type_id, name, description,
+                          max_concurrency=1, journal_path=None):
         """
         Upload already serialized raw data as a new dataset.
 
         Parameters
         ----------
-        raw_data: bytes
-            Dataset contents to upload.
+        raw_data: bytes or str
+            Dataset contents to upload. Any object supporting the buffer
+            protocol, such as bytearray, memoryview or mmap, is uploaded
+            without being copied. A str is uploaded encoded as UTF-8.
         data_type_id : str
             Serialization format of the raw data.
             Supported formats are:
@@ -528,6 +740,14 @@ class Datasets(object):
             Name for the new dataset.
         description : str
             Description for the new dataset.
+        max_concurrency : int, optional
+            Maximum number of blocks of data uploaded in parallel. The
+            pool_maxsize of the workspace should be at least as large.
+        journal_path : str, optional
+            Path of a file recording the progress of the upload. If the upload
+            is interrupted, calling this again with the same data and journal
+            only sends the blocks that are missing. The file is deleted once
+            the dataset is created.
 
         Returns
         -------
@@ -542,23 +762,160 @@ class Datasets(object):
         _not_none_or_empty('name', name)
         _not_none_or_empty('description', description)
 
-        return self._upload(raw_data, data_type_id, name, description)
+        return self._upload(raw_data, data_type_id, name, description,
+                            max_concurrency, journal_path)
+
+    def add_from_file(self, file, data_type_id, name, description,
+                      max_concurrency=1, journal_path=None):
+        """
+        Upload the contents of a file as a new dataset.
+
+        The file is uploaded one block at a time and is never loaded in memory
+        as a whole. Files stored on disk are memory mapped.
+
+        Parameters
+        ----------
+        file : str or file
+            Path of the file to upload, or file-like object to read from.
+            File objects must be opened in binary mode.
+        data_type_id : str
+            Serialization format of the file contents.
+            Supported formats are:
+                'PlainText'
+                'GenericCSV'
+                'GenericTSV'
+                'GenericCSVNoHeader'
+                'GenericTSVNoHeader'
+                'ARFF'
+            See the azureml.DataTypeIds class for constants.
+        name : str
+            Name for the new dataset.
+        description : str
+            Description for the new dataset.
+        max_concurrency : int, optional
+            Maximum number of blocks of data uploaded in parallel. The
+            pool_maxsize of the workspace should be at least as large.
+        journal_path : str, optional
+            Path of a file recording the progress of the upload. If the upload
+            is interrupted, calling this again with the same data and journal
+            only sends the blocks that are missing. The file is deleted once
+            the dataset is created.
+
+        Returns
+        -------
+        SourceDataset
+            Dataset that was just created.
+        """
+        _not_none('file', file)
+        _not_none_or_empty('data_type_id', data_type_id)
+        _not_none_or_empty('name', name)
+        _not_none_or_empty('description', description)
+
+        if not hasattr(file, 'read'):
+            with open(file, 'rb') as reader:
+                return self.add_from_file(reader, data_type_id, name,
+                                          description, max_concurrency,
+                                          journal_path)
+
+        dataset_id = self.workspace._rest.upload_dataset_from_file(
+            self.workspace.workspace_id, name, description, data_type_id,
+            file, None, max_concurrency=max_concurrency,
+            journal_path=journal_path)
+
+        return self._get_uploaded_dataset(dataset_id)
+
+    def add_from_stream(self, stream, data_type_id, name, description,
+                        size=None, max_concurrency=1, journal_path=None):
+        """
+        Upload the chunks of bytes produced by an iterable as a new dataset.
+
+        Parameters
+        ----------
+        stream : iterable
+            Iterable of bytes objects of any length, such as a generator or
+            the iter_content() of a streamed HTTP response.
+        data_type_id : str
+            Serialization format of the raw data.
+            Supported formats are:
+                'PlainText'
+                'GenericCSV'
+                'GenericTSV'
+                'GenericCSVNoHeader'
+                'GenericTSVNoHeader'
+                'ARFF'
+            See the azureml.DataTypeIds class for constants.
+        name : str
+            Name for the new dataset.
+        description : str
+            Description for the new dataset.
+        size : int, optional
+            Total number of bytes in the stream. When specified, the stream is
+            uploaded as it is read, holding a single block in memory.
+            Otherwise it is first written to a temporary file, since every
+            block request needs the total number of blocks.
+        max_concurrency : int, optional
+            Maximum number of blocks of data uploaded in parallel. The
+            pool_maxsize of the workspace should be at least as large.
+        journal_path : str, optional
+            Path of a file recording the progress of the upload. If the upload
+            is interrupted, calling this again with the same data and journal
+            only sends the blocks that are missing. The file is deleted once
+            the dataset is created.
+
+        Returns
+        -------
+        SourceDataset
+            Dataset that was just created.
+        """
+        _not_none('stream', stream)
+        _not_none_or_empty('data_type_id', data_type_id)
+        _not_none_or_empty('name', name)
+        _not_none_or_empty('description', description)
+
+        dataset_id = self.workspace._rest.upload_dataset_from_stream(
+            self.workspace.workspace_id, name, description, data_type_id,
+            stream, size, None, max_concurrency=max_concurrency,
+            journal_path=journal_path)
+
+        return self._get_uploaded_dataset(dataset_id)
 
-    def _upload(self, raw_data, data_type_id, name, description):
+    def _upload(self, raw_data, data_type_id, name, description,
+                max_concurrency, journal_path):
         dataset_id = self.workspace._rest.upload_dataset(
             self.workspace.workspace_id, name, description, data_type_id,
-            raw_data, None)
+            raw_data, None, max_concurrency=max_concurrency,
+            journal_path=journal_path)
 
+        return self._get_uploaded_dataset(dataset_id)
+
+    def _get_uploaded_dataset(self, dataset_id):
+        self.workspace._datasets_listing.invalidate()
         metadata = self.workspace._rest.get_dataset(
             self.workspace.workspace_id, dataset_id)
 
         return self._create_dataset(metadata)
 
-    def _get_datasets(self):
-        datasets = self.workspace._rest.get_datasets(self.workspace.workspace_id)
+    def _get_catalog(self):
+        return self.workspace._datasets_listing.get()
+
+    def _get_datasets(self, catalog=None):
+        if catalog is None:
+            catalog = self._get_catalog()
+        return catalog.items if self._example_filter is None else \
+            catalog.view(self._example_filter, self._is_included)
+
+    def _get_by_name(self, catalog, name):
+        for dataset in self._filter(catalog.find('Name', name)):
+            return self._create_dataset(dataset)
+
+        raise IndexError('A data set named "{}" does not exist'.format(name))
+
+    def _filter(self, datasets):
         return datasets if self._example_filter is None else \
-            (d for d in datasets if d['Id'].startswith(
-                _GLOBAL_WORKSPACE_ID) == self._example_filter)
+            [d for d in datasets if self._is_included(d)]
+
+    def _is_included(self, dataset):
+        return dataset['Id'].startswith(_GLOBAL_WORKSPACE_ID) == self._example_filter
 
     def _create_dataset(self, metadata):
         return SourceDataset(self.workspace, metadata)
@@ -627,12 +984,43 @@ class IntermediateDataset(Dataset):
             self.port_name
         )
 
-    def _to_dataframe(self):
-        """Read and return the dataset contents as a pandas DataFrame."""
+    def _to_dataframe(self, chunksize=None, columns=None, dtypes=None,
+                      engine=None):
+        """
+        Read and return the dataset contents as a pandas DataFrame.
+
+        If chunksize is specified, return an iterator of DataFrames of up to
+        chunksize rows instead. The contents are parsed as they are
+        downloaded, so memory use depends on chunksize rather than on the
+        size of the dataset.
+
+        Specify columns to parse only these columns, and dtypes to set the
+        data types of columns instead of inferring them. Specify
+        engine='parallel' to parse csv and tsv contents on several threads.
+        See azureml.deserialize_dataframe.
+        """
+        if chunksize is not None:
+            return self._iter_dataframes(chunksize, columns, dtypes, engine)
+
         #TODO: figure out why passing in the opened stream directly gives invalid data
         data = self.read_as_binary()
         reader = BytesIO(data)
-        return deserialize_dataframe(reader, self.data_type_id)
+        return deserialize_dataframe(
+            reader, self.data_type_id, columns=columns, dtypes=dtypes,
+            engine=engine)
+
+    def _iter_dataframes(self, chunksize, columns, dtypes, engine):
+        # unlike the raw stream returned by open(), this stream is decoded
+        # from the content encoding of the response
+        with self.workspace._rest.stream_intermediate_dataset_contents(
+                self.workspace.workspace_id,
+                self.experiment.experiment_id,
+                self.node_id,
+                self.port_name) as reader:
+            for dataframe in deserialize_dataframe(
+                    reader, self.data_type_id, chunksize=chunksize,
+                    columns=columns, dtypes=dtypes, engine=engine):
+                yield dataframe
 
 
 class Experiment(object):
@@ -789,26 +1177,97 @@ class Experiments(object):
             yield self._create_experiment(experiment)
 
     def __len__(self):
-        return sum(1 for _ in self._get_experiments())
+        return len(self._get_experiments())
 
     def __getitem__(self, index):
         '''Retrieve an experiment by index or by id.'''
         _not_none('index', index)
 
-        experiments = self._get_experiments()
         if isinstance(index, numbers.Integral):
-            return self._create_experiment(list(experiments)[index])
+            return self._create_experiment(self._get_experiments()[index])
         else:
-            for experiment in experiments:
-                if experiment['ExperimentId'] == index:
-                    return self._create_experiment(experiment)
+            return self._get_by_id(self._get_catalog(), index)
+
+    def get_many(self, experiment_ids):
+        """
+        Retrieve several experiments by id, from a single listing of the
+        workspace.
+
+        Parameters
+        ----------
+        experiment_ids : iterable of str
+            Ids of the experiments.
+
+        Returns
+        -------
+        list of Experiment, in the order of the ids.
+        """
+        _not_none('experiment_ids', experiment_ids)
+
+        catalog = self._get_catalog()
+        return [self._get_by_id(catalog, experiment_id) for experiment_id in experiment_ids]
+
+    def get_by_id(self, experiment_id):
+        """
+        Retrieve an experiment by id, with a single request instead of a
+        listing of the workspace.
+
+        Parameters
+        ----------
+        experiment_id : str
+            Unique identifier of the experiment.
+        """
+        _not_none_or_empty('experiment_id', experiment_id)
+
+        return self.get_many_by_id([experiment_id], max_connections=1)[0]
 
-        raise IndexError('An experiment with the id "{}" does not exist'.format(index))
+    def get_many_by_id(self, experiment_ids, max_connections=None):
+        """
+        Retrieve several experiments by id, with one request per experiment
+        sent in parallel, instead of a listing of the workspace.
+
+        Parameters
+        ----------
+        experiment_ids : iterable of str
+            Unique identifiers of the experiments.
+        max_connections : int, optional
+            Maximum number of requests in flight. The pool_maxsize of the
+            workspace should be at least as large.
+
+        Returns
+        -------
+        list of Experiment, in the order of the ids.
+        """
+        _not_none('experiment_ids', experiment_ids)
+
+        experiment_ids = list(experiment_ids)
+        experiments = self.workspace._rest.get_experiments_by_id(
+            self.workspace.workspace_id, experiment_ids, max_connections)
+        for experiment_id, experiment in zip(experiment_ids, experiments):
+            if experiment is None or \
+                    (self._example_filter is not None and not self._is_included(experiment)):
+                raise IndexError('An experiment with the id "{}" does not exist'.format(experiment_id))
+
+        return [self._create_experiment(experiment) for experiment in experiments]
+
+    def _get_catalog(self):
+        return self.workspace._experiments_listing.get()
 
-    def _get_experiments(self):
-        experiments = self.workspace._rest.get_experiments(self.workspace.workspace_id)
-        return experiments if self._example_filter is None else \
-            (e for e in experiments if e['ExperimentId'].startswith(_GLOBAL_WORKSPACE_ID) == self._example_filter)
+    def _get_experiments(self, catalog=None):
+        if catalog is None:
+            catalog = self._get_catalog()
+        return catalog.items if self._example_filter is None else \
+            catalog.view(self._example_filter, self._is_included)
+
+    def _get_by_id(self, catalog, experiment_id):
+        for experiment in catalog.find('ExperimentId', experiment_id):
+            if self._example_filter is None or self._is_included(experiment):
+                return self._create_experiment(experiment)
+
+        raise IndexError('An experiment with the id "{}" does not exist'.format(experiment_id))
+
+    def _is_included(self, experiment):
+        return experiment['ExperimentId'].startswith(_GLOBAL_WORKSPACE_ID) == self._example_filter
 
     def _create_experiment(self, metadata):
         return Experiment(self.workspace, metadata)
@@ -859,8 +1318,12 @@ def _get_workspace_info(workspace_id, authorization_token, endpoint, management_
     return workspace_id, authorization_token, endpoint, management_endpoint
 
 class Workspace(object):
+    DEFAULT_METADATA_TTL = 60.0
 
-    def __init__(self, workspace_id = None, authorization_token = None, endpoint=None):
+    def __init__(self, workspace_id = None, authorization_token = None, endpoint=None,
+                 pool_connections=None, pool_maxsize=None, pool_block=False,
+                 keep_alive=True, retry_policy=None, cache=None,
+                 metadata_ttl=DEFAULT_METADATA_TTL, timeout=None):
         """
         Initialize a workspace.
 
@@ -875,6 +1338,39 @@ class Workspace(object):
         endpoint: str
             URL of the endpoint to connect to. Specify this only if you host
             ML Studio on your own server(s).
+        pool_connections: int, optional
+            Number of hosts to keep a connection pool for. The REST API and
+            the blob storage hosting the dataset contents each use one.
+        pool_maxsize: int, optional
+            Maximum number of connections kept open to a single host.
+        pool_block: bool, optional
+            True to wait for a free connection when pool_maxsize connections
+            to a host are in use, False to open an extra one.
+        keep_alive: bool, optional
+            False to close each connection after its request instead of
+            reusing it.
+        retry_policy: RetryPolicy, optional
+            Policy for retrying requests that fail with a transient error.
+            Defaults to RetryPolicy(), use RetryPolicy(max_attempts=1) to
+            disable retries.
+        cache: DatasetCache, optional
+            On-disk cache for the contents of the datasets, so that reading
+            the same version of a dataset again does not download it again.
+        metadata_ttl: float, optional
+            Number of seconds the listings of the datasets and experiments
+            are reused for, before they are requested again. Use 0 to request
+            them on every access, None to keep them until refresh() is called.
+            Adding or updating a dataset through the workspace always
+            refreshes the datasets.
+        timeout: float or tuple, optional
+            Number of seconds to wait for the connection to a server, and then
+            for each read of its response, as a (connect, read) tuple or a
+            single number for both. Defaults to (10, 120). A request that
+            times out is retried according to retry_policy.
+
+        The connections are shared by every request made through the
+        workspace. Call close(), or use the workspace as a context manager,
+        to release them.
 
         Parameters that are omitted will be read from ~/.azureml/settings.ini:
         [workspace]
@@ -892,7 +1388,25 @@ class Workspace(object):
         self.authorization_token = authorization_token
         self.api_endpoint = endpoint
         self.management_endpoint = management_endpoint
-        self._rest = _RestClient(endpoint, authorization_token)
+        self.cache = cache
+        self._rest = _RestClient(
+            endpoint,
+            authorization_token,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            retry_policy=retry_policy,
+            timeout=timeout,
+        )
+        self._datasets_listing = _MetadataCache(
+            lambda: _Catalog(self._rest.get_datasets(self.workspace_id),
+                             ('Name', 'Id', 'FamilyId', 'DataTypeId')),
+            metadata_ttl)
+        self._experiments_listing = _MetadataCache(
+            lambda: _Catalog(self._rest.get_experiments(self.workspace_id),
+                             ('ExperimentId',)),
+            metadata_ttl)
         self.datasets = Datasets(workspace=self)
         self.user_datasets = Datasets(workspace=self, example_filter=False)
         self.example_datasets = Datasets(workspace=self, example_filter=True)
@@ -900,6 +1414,24 @@ class Workspace(object):
         self.user_experiments = Experiments(workspace=self, example_filter=False)
         self.example_experiments = Experiments(workspace=self, example_filter=True)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def refresh(self):
+        """
+        Discard the cached listings of the datasets and experiments, so that
+        the next access requests them again.
+        """
+        self._datasets_listing.invalidate()
+        self._experiments_listing.invalidate()
+
+    def close(self):
+        """Close the connections held open to the workspace and its storage."""
+        self._rest.close()
+
 
 _manglingPattern = re.compile(r'[\W_]+')
 
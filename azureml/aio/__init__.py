@@ -0,0 +1,548 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation
+# All rights reserved.
+#
+# MIT License:
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#--------------------------------------------------------------------------
+
+"""
+Asynchronous client for Azure ML workspaces, for use with asyncio.
+
+Requires aiohttp, installed with: pip install azureml[aio]
+
+The classes mirror those of the azureml package, with coroutines in place of
+the methods that send requests. The requests of a workspace share a pool of
+connections, so a single event loop can drive many transfers concurrently:
+
+>>> async with Workspace() as ws:
+...     datasets = await ws.datasets.get_many(names)
+...     frames = await asyncio.gather(*[d.to_dataframe() for d in datasets])
+"""
+
+import asyncio
+from io import BytesIO
+
+import azureml
+from azureml import (
+    _GLOBAL_WORKSPACE_ID,
+    _get_workspace_info,
+)
+from azureml.aio.http import _AsyncRestClient
+from azureml.cache import (
+    _Catalog,
+    _MetadataCache,
+    _clock,
+)
+from azureml.errors import (
+    _not_none,
+    _not_none_or_empty,
+)
+from azureml.serialization import (
+    deserialize_dataframe,
+    serialize_dataframe,
+)
+
+
+def _run_in_executor(func, *args):
+    """Runs func on the default executor, to keep the event loop responsive."""
+    return asyncio.get_event_loop().run_in_executor(None, func, *args)
+
+
+def _serialize_dataframe(data_type_id, dataframe, max_workers):
+    output = BytesIO()
+    serialize_dataframe(output, data_type_id, dataframe, max_workers)
+    # a view of the buffer, which the upload slices without copying
+    return output.getbuffer()
+
+
+class _AsyncMetadataCache(_MetadataCache):
+    """
+    INTERNAL USE ONLY. Asynchronous counterpart of _MetadataCache, where
+    fetch is a coroutine function.
+    """
+
+    def __init__(self, fetch, ttl):
+        super(_AsyncMetadataCache, self).__init__(fetch, ttl)
+        self._async_lock = None
+
+    async def get(self):
+        if self.ttl == 0:
+            return await self._fetch()
+
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            if self._value is None or \
+                    (self._expires is not None and _clock() >= self._expires):
+                self._value = await self._fetch()
+                if self.ttl is not None:
+                    self._expires = _clock() + self.ttl
+            return self._value
+
+
+class SourceDataset(azureml.SourceDataset):
+    """Metadata for a dataset and coroutines to read its contents."""
+
+    async def open(self):
+        """
+        Open and return a stream for the dataset contents. Read it to the
+        end, so that its connection returns to the pool.
+        """
+        return await self.workspace._rest.open_dataset_contents(self.contents_url)
+
+    async def read_as_binary(self):
+        '''Read and return the dataset contents as binary.'''
+        return await self.workspace._rest.read_dataset_contents_binary(self.contents_url)
+
+    async def read_as_text(self):
+        '''Read and return the dataset contents as text.'''
+        return await self.workspace._rest.read_dataset_contents_text(self.contents_url)
+
+    async def _to_dataframe(self):
+        """Read and return the dataset contents as a pandas DataFrame."""
+        data = await self.read_as_binary()
+        return await _run_in_executor(
+            deserialize_dataframe, BytesIO(data), self.data_type_id)
+
+    async def _update_from_dataframe(self, dataframe, data_type_id=None,
+                                     name=None, description=None,
+                                     max_concurrency=1, max_workers=None):
+        """
+        Serialize the specified DataFrame and replace the existing dataset.
+        See azureml.SourceDataset.update_from_dataframe for the parameters.
+        """
+        _not_none('dataframe', dataframe)
+
+        if data_type_id is None:
+            data_type_id = self.data_type_id
+
+        raw_data = await _run_in_executor(
+            _serialize_dataframe, data_type_id, dataframe, max_workers)
+        await self._update_from_raw_data(
+            raw_data, data_type_id, name, description, max_concurrency)
+
+    async def _update_from_raw_data(self, raw_data, data_type_id=None,
+                                    name=None, description=None,
+                                    max_concurrency=1):
+        """
+        Upload already serialized raw data and replace the existing dataset.
+        See azureml.SourceDataset.update_from_raw_data for the parameters.
+        """
+        _not_none('raw_data', raw_data)
+
+        if data_type_id is None:
+            data_type_id = self.data_type_id
+        if name is None:
+            name = self.name
+        if description is None:
+            description = self.description
+
+        dataset_id = await self.workspace._rest.upload_dataset(
+            self.workspace.workspace_id,
+            name,
+            description,
+            data_type_id,
+            raw_data,
+            self.family_id,
+            max_concurrency=max_concurrency,
+        )
+        self.workspace._datasets_listing.invalidate()
+
+        self._metadata = await self.workspace._rest.get_dataset(
+            self.workspace.workspace_id,
+            dataset_id
+        )
+
+
+class Datasets(object):
+    def __init__(self, workspace, example_filter=None):
+        """
+        INTERNAL USE ONLY. Initialize a dataset collection.
+
+        Parameters
+        ----------
+        workspace : Workspace
+            Parent workspace of the datasets.
+        example_filter : bool
+            True to include only examples.
+            False to include only user-created.
+            None to include all.
+        """
+        _not_none('workspace', workspace)
+
+        self.workspace = workspace
+        self._example_filter = example_filter
+
+    async def list(self):
+        """Retrieve all the datasets, in listing order."""
+        catalog = await self.workspace._datasets_listing.get()
+        return [self._create_dataset(dataset) for dataset in self._filter(catalog.items)]
+
+    async def get(self, name):
+        '''Retrieve a dataset by name (case-sensitive).'''
+        _not_none('name', name)
+
+        return (await self.get_many([name]))[0]
+
+    async def get_many(self, names):
+        """
+        Retrieve several datasets by name (case-sensitive), from a single
+        listing of the workspace, in the order of the names.
+        """
+        _not_none('names', names)
+
+        catalog = await self.workspace._datasets_listing.get()
+        result = []
+        for name in names:
+            datasets = self._filter(catalog.find('Name', name))
+            if not datasets:
+                raise IndexError('A data set named "{}" does not exist'.format(name))
+            result.append(self._create_dataset(datasets[0]))
+        return result
+
+    async def get_by_id(self, dataset_id):
+        """
+        Retrieve a dataset by id, with a single request instead of a listing
+        of the workspace.
+        """
+        _not_none_or_empty('dataset_id', dataset_id)
+
+        return (await self.get_many_by_id([dataset_id]))[0]
+
+    async def get_many_by_id(self, dataset_ids):
+        """
+        Retrieve several datasets by id, with concurrent requests instead of
+        a listing of the workspace, in the order of the ids.
+        """
+        _not_none('dataset_ids', dataset_ids)
+
+        dataset_ids = list(dataset_ids)
+        datasets = await self.workspace._rest.get_datasets_by_id(
+            self.workspace.workspace_id, dataset_ids)
+
+        for dataset_id, dataset in zip(dataset_ids, datasets):
+            if dataset is None or not self._filter([dataset]):
+                raise IndexError('A data set with the id "{}" does not exist'.format(dataset_id))
+
+        return [self._create_dataset(dataset) for dataset in datasets]
+
+    async def find(self, data_type_id=None, family_id=None):
+        """
+        Retrieve the datasets with the specified format and/or family.
+        See azureml.Datasets.find for the parameters.
+        """
+        catalog = await self.workspace._datasets_listing.get()
+        if family_id is not None:
+            datasets = catalog.find('FamilyId', family_id)
+            if data_type_id is not None:
+                datasets = [d for d in datasets if d['DataTypeId'] == data_type_id]
+        elif data_type_id is not None:
+            datasets = catalog.find('DataTypeId', data_type_id)
+        else:
+            datasets = catalog.items
+
+        return [self._create_dataset(dataset) for dataset in self._filter(datasets)]
+
+    async def add_from_dataframe(self, dataframe, data_type_id, name,
+                                 description, max_concurrency=1,
+                                 max_workers=None):
+        """
+        Serialize the specified DataFrame and upload it as a new dataset.
+        See azureml.Datasets.add_from_dataframe for the parameters.
+        """
+        _not_none('dataframe', dataframe)
+        _not_none_or_empty('data_type_id', data_type_id)
+        _not_none_or_empty('name', name)
+        _not_none_or_empty('description', description)
+
+        raw_data = await _run_in_executor(
+            _serialize_dataframe, data_type_id, dataframe, max_workers)
+        return await self._upload(
+            raw_data, data_type_id, name, description, max_concurrency)
+
+    async def add_from_raw_data(self, raw_data, data_type_id, name,
+                                description, max_concurrency=1):
+        """
+        Upload already serialized raw data as a new dataset.
+        See azureml.Datasets.add_from_raw_data for the parameters.
+        """
+        _not_none('raw_data', raw_data)
+        _not_none_or_empty('data_type_id', data_type_id)
+        _not_none_or_empty('name', name)
+        _not_none_or_empty('description', description)
+
+        return await self._upload(
+            raw_data, data_type_id, name, description, max_concurrency)
+
+    async def _upload(self, raw_data, data_type_id, name, description,
+                      max_concurrency):
+        dataset_id = await self.workspace._rest.upload_dataset(
+            self.workspace.workspace_id, name, description, data_type_id,
+            raw_data, None, max_concurrency=max_concurrency)
+
+        self.workspace._datasets_listing.invalidate()
+        metadata = await self.workspace._rest.get_dataset(
+            self.workspace.workspace_id, dataset_id)
+        return self._create_dataset(metadata)
+
+    def _filter(self, datasets):
+        return datasets if self._example_filter is None else \
+            [d for d in datasets if d['Id'].startswith(
+                _GLOBAL_WORKSPACE_ID) == self._example_filter]
+
+    def _create_dataset(self, metadata):
+        return SourceDataset(self.workspace, metadata)
+
+
+class IntermediateDataset(azureml.IntermediateDataset):
+    """Represents an intermediate dataset and coroutines to read its contents."""
+
+    async def open(self):
+        """
+        Open and return a stream for the dataset contents. Read it to the
+        end, so that its connection returns to the pool.
+        """
+        return await self.workspace._rest.open_intermediate_dataset_contents(
+            self.workspace.workspace_id,
+            self.experiment.experiment_id,
+            self.node_id,
+            self.port_name
+        )
+
+    async def read_as_binary(self):
+        '''Read and return the dataset contents as binary.'''
+        return await self.workspace._rest.read_intermediate_dataset_contents_binary(
+            self.workspace.workspace_id,
+            self.experiment.experiment_id,
+            self.node_id,
+            self.port_name
+        )
+
+    async def read_as_text(self):
+        '''Read and return the dataset contents as text.'''
+        return await self.workspace._rest.read_intermediate_dataset_contents_text(
+            self.workspace.workspace_id,
+            self.experiment.experiment_id,
+            self.node_id,
+            self.port_name
+        )
+
+    async def _to_dataframe(self):
+        """Read and return the dataset contents as a pandas DataFrame."""
+        data = await self.read_as_binary()
+        return await _run_in_executor(
+            deserialize_dataframe, BytesIO(data), self.data_type_id)
+
+
+class Experiment(azureml.Experiment):
+
+    def get_intermediate_dataset(self, node_id, port_name, data_type_id):
+        """
+        Get an intermediate dataset.
+        See azureml.Experiment.get_intermediate_dataset for the parameters.
+        """
+        return IntermediateDataset(self.workspace, self, node_id, port_name, data_type_id)
+
+
+class Experiments(object):
+    def __init__(self, workspace, example_filter=None):
+        """
+        INTERNAL USE ONLY. Initialize an experiment collection.
+
+        Parameters
+        ----------
+        workspace : Workspace
+            Parent workspace of the experiments.
+        example_filter : bool
+            True to include only examples.
+            False to include only user-created.
+            None to include all.
+        """
+        _not_none('workspace', workspace)
+
+        self.workspace = workspace
+        self._example_filter = example_filter
+
+    async def list(self):
+        """Retrieve all the experiments, in listing order."""
+        catalog = await self.workspace._experiments_listing.get()
+        return [self._create_experiment(e) for e in self._filter(catalog.items)]
+
+    async def get(self, experiment_id):
+        '''Retrieve an experiment by id, from the listing of the workspace.'''
+        _not_none('experiment_id', experiment_id)
+
+        return (await self.get_many([experiment_id]))[0]
+
+    async def get_many(self, experiment_ids):
+        """
+        Retrieve several experiments by id, from a single listing of the
+        workspace, in the order of the ids.
+        """
+        _not_none('experiment_ids', experiment_ids)
+
+        catalog = await self.workspace._experiments_listing.get()
+        result = []
+        for experiment_id in experiment_ids:
+            experiments = self._filter(catalog.find('ExperimentId', experiment_id))
+            if not experiments:
+                raise IndexError('An experiment with the id "{}" does not exist'.format(experiment_id))
+            result.append(self._create_experiment(experiments[0]))
+        return result
+
+    async def get_by_id(self, experiment_id):
+        """
+        Retrieve an experiment by id, with a single request instead of a
+        listing of the workspace.
+        """
+        _not_none_or_empty('experiment_id', experiment_id)
+
+        return (await self.get_many_by_id([experiment_id]))[0]
+
+    async def get_many_by_id(self, experiment_ids):
+        """
+        Retrieve several experiments by id, with concurrent requests instead
+        of a listing of the workspace, in the order of the ids.
+        """
+        _not_none('experiment_ids', experiment_ids)
+
+        experiment_ids = list(experiment_ids)
+        experiments = await self.workspace._rest.get_experiments_by_id(
+            self.workspace.workspace_id, experiment_ids)
+
+        for experiment_id, experiment in zip(experiment_ids, experiments):
+            if experiment is None or not self._filter([experiment]):
+                raise IndexError('An experiment with the id "{}" does not exist'.format(experiment_id))
+
+        return [self._create_experiment(e) for e in experiments]
+
+    def _filter(self, experiments):
+        return experiments if self._example_filter is None else \
+            [e for e in experiments if e['ExperimentId'].startswith(
+                _GLOBAL_WORKSPACE_ID) == self._example_filter]
+
+    def _create_experiment(self, metadata):
+        return Experiment(self.workspace, metadata)
+
+
+class Workspace(object):
+    DEFAULT_METADATA_TTL = azureml.Workspace.DEFAULT_METADATA_TTL
+
+    def __init__(self, workspace_id=None, authorization_token=None,
+                 endpoint=None, limit=None, limit_per_host=None,
+                 keep_alive=True, retry_policy=None,
+                 metadata_ttl=DEFAULT_METADATA_TTL, timeout=None):
+        """
+        Initialize a workspace.
+
+        Parameters
+        ----------
+        workspace_id : str
+            Unique identifier for the existing workspace. Can be obtained from
+            the URL in ML Studio when editing a workspace.
+        authorization_token: str
+            Access token for the workspace. Can be the primary or secondary
+            token managed in ML Studio.
+        endpoint: str
+            URL of the endpoint to connect to. Specify this only if you host
+            ML Studio on your own server(s).
+        limit: int, optional
+            Maximum number of connections open at the same time, across all
+            hosts. Defaults to 100.
+        limit_per_host: int, optional
+            Maximum number of connections open to a single host. Defaults to
+            no limit other than limit.
+        keep_alive: bool, optional
+            False to close each connection after its request instead of
+            reusing it.
+        retry_policy: RetryPolicy, optional
+            Policy for retrying requests that fail with a transient error.
+        metadata_ttl: float, optional
+            Number of seconds the listings of the datasets and experiments
+            are reused for. See azureml.Workspace.
+        timeout: float or tuple, optional
+            Number of seconds to wait for the connection to a server, and then
+            for each read of its response, as a (connect, read) tuple or a
+            single number for both. Defaults to (10, 120), as for
+            azureml.Workspace. A request is never cancelled as a whole, so
+            large transfers can take as long as they need.
+
+        Use the workspace as an asynchronous context manager, or await
+        close(), to release its connections.
+
+        Parameters that are omitted are read from the same settings files as
+        azureml.Workspace.
+        """
+        workspace_id, authorization_token, endpoint, management_endpoint = _get_workspace_info(workspace_id, authorization_token, endpoint, None)
+
+        _not_none_or_empty('workspace_id', workspace_id)
+        _not_none_or_empty('authorization_token', authorization_token)
+        _not_none_or_empty('endpoint', endpoint)
+
+        self.workspace_id = workspace_id
+        self.authorization_token = authorization_token
+        self.api_endpoint = endpoint
+        self.management_endpoint = management_endpoint
+        self._rest = _AsyncRestClient(
+            endpoint,
+            authorization_token,
+            limit=limit,
+            limit_per_host=limit_per_host,
+            keep_alive=keep_alive,
+            retry_policy=retry_policy,
+            timeout=timeout,
+        )
+        self._datasets_listing = _AsyncMetadataCache(
+            self._get_datasets_catalog, metadata_ttl)
+        self._experiments_listing = _AsyncMetadataCache(
+            self._get_experiments_catalog, metadata_ttl)
+        self.datasets = Datasets(workspace=self)
+        self.user_datasets = Datasets(workspace=self, example_filter=False)
+        self.example_datasets = Datasets(workspace=self, example_filter=True)
+        self.experiments = Experiments(workspace=self)
+        self.user_experiments = Experiments(workspace=self, example_filter=False)
+        self.example_experiments = Experiments(workspace=self, example_filter=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def refresh(self):
+        """
+        Discard the cached listings of the datasets and experiments, so that
+        the next access requests them again.
+        """
+        self._datasets_listing.invalidate()
+        self._experiments_listing.invalidate()
+
+    async def close(self):
+        """Close the connections held open to the workspace and its storage."""
+        await self._rest.close()
+
+    async def _get_datasets_catalog(self):
+        datasets = await self._rest.get_datasets(self.workspace_id)
+        return _Catalog(datasets, ('Name', 'Id', 'FamilyId', 'DataTypeId'))
+
+    async def _get_experiments_catalog(self):
+        experiments = await self._rest.get_experiments(self.workspace_id)
+        return _Catalog(experiments, ('ExperimentId',))
@@ -0,0 +1,313 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation
+# All rights reserved.
+#
+# MIT License:
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#--------------------------------------------------------------------------
+
+import asyncio
+import json
+from urllib.parse import urljoin
+
+import aiohttp
+
+from azureml.errors import (
+    AzureMLConflictHttpError,
+    AzureMLHttpError,
+)
+from azureml.http import (
+    RetryPolicy,
+    _RestApi,
+    _byte_view,
+    _get_retry_after,
+)
+
+
+_CONNECTION_ERRORS = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+
+
+async def _read_json(response):
+    return json.loads(await response.text())
+
+
+async def _read_binary(response):
+    return await response.read()
+
+
+async def _read_text(response):
+    return await response.text()
+
+
+def _get_client_timeout(timeout):
+    """
+    Returns the aiohttp.ClientTimeout for a timeout given as for _RestClient:
+    a (connect, read) tuple or a single number for both. There is no limit
+    on a whole request, so that large transfers are not cancelled, nor on
+    the wait for a free connection of the pool.
+    """
+    if isinstance(timeout, aiohttp.ClientTimeout):
+        return timeout
+    if not isinstance(timeout, tuple):
+        timeout = (timeout, timeout)
+    connect, read = timeout
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect,
+                                 sock_read=read)
+
+
+class _AsyncRestClient(_RestApi):
+    """
+    Asynchronous counterpart of azureml.http._RestClient, which sends its
+    requests with aiohttp. The session is created by the first request, so
+    that it belongs to the running loop.
+    """
+    DEFAULT_LIMIT = 100
+
+    def __init__(self, service_endpoint, access_token, limit=None,
+                 limit_per_host=None, keep_alive=True, retry_policy=None,
+                 timeout=None):
+        self._service_endpoint = service_endpoint
+        self._access_token = access_token
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._timeout = _get_client_timeout(timeout or self.DEFAULT_TIMEOUT)
+        self._limit = limit or self.DEFAULT_LIMIT
+        self._limit_per_host = limit_per_host or 0
+        self._keep_alive = keep_alive
+        self._session = None
+
+    async def close(self):
+        """Closes the pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_experiments(self, workspace_id):
+        """Runs HTTP GET request to retrieve the list of experiments."""
+        api_path = self.EXPERIMENTS_URI_FMT.format(workspace_id)
+        return await self._send_get_req(api_path)
+
+    async def get_experiment(self, workspace_id, experiment_id):
+        """Runs HTTP GET request to retrieve a single experiment."""
+        api_path = self.EXPERIMENT_URI_FMT.format(workspace_id, experiment_id)
+        return await self._send_get_req(api_path)
+
+    async def get_experiments_by_id(self, workspace_id, experiment_ids):
+        """
+        Runs concurrent HTTP GET requests to retrieve several experiments in
+        the order of their ids. Returns None in place of the experiments that
+        do not exist.
+        """
+        return await self._get_many(
+            self.get_experiment, workspace_id, experiment_ids)
+
+    async def get_datasets(self, workspace_id):
+        """Runs HTTP GET request to retrieve the list of datasets."""
+        api_path = self.DATASOURCES_URI_FMT.format(workspace_id)
+        return await self._send_get_req(api_path)
+
+    async def get_dataset(self, workspace_id, dataset_id):
+        """Runs HTTP GET request to retrieve a single dataset."""
+        api_path = self.DATASOURCE_URI_FMT.format(workspace_id, dataset_id)
+        return await self._send_get_req(api_path)
+
+    async def get_datasets_by_id(self, workspace_id, dataset_ids):
+        """
+        Runs concurrent HTTP GET requests to retrieve several datasets in the
+        order of their ids. Returns None in place of the datasets that do not
+        exist.
+        """
+        return await self._get_many(self.get_dataset, workspace_id, dataset_ids)
+
+    async def _get_many(self, get, workspace_id, ids):
+        async def get_or_none(id):
+            try:
+                return await get(workspace_id, id)
+            except AzureMLHttpError as e:
+                if e.status_code != 404:
+                    raise
+                return None
+
+        return await asyncio.gather(*[get_or_none(id) for id in ids])
+
+    async def open_intermediate_dataset_contents(self, workspace_id,
+                                                 experiment_id, node_id,
+                                                 port_name):
+        response = await self._get_intermediate_dataset_contents(
+            workspace_id, experiment_id, node_id, port_name, None)
+        return response.content
+
+    async def read_intermediate_dataset_contents_binary(self, workspace_id,
+                                                        experiment_id,
+                                                        node_id, port_name):
+        return await self._get_intermediate_dataset_contents(
+            workspace_id, experiment_id, node_id, port_name, _read_binary)
+
+    async def read_intermediate_dataset_contents_text(self, workspace_id,
+                                                      experiment_id, node_id,
+                                                      port_name):
+        return await self._get_intermediate_dataset_contents(
+            workspace_id, experiment_id, node_id, port_name, _read_text)
+
+    async def _get_intermediate_dataset_contents(self, workspace_id,
+                                                 experiment_id, node_id,
+                                                 port_name, read):
+        api_path = self.INTERMEDIATE_DATASET_URI_FMT.format(
+            workspace_id, experiment_id, node_id, port_name)
+        return await self._send_request(
+            'GET',
+            urljoin(self._service_endpoint, api_path),
+            read,
+            headers=self._get_headers(),
+        )
+
+    async def open_dataset_contents(self, url):
+        response = await self._send_request('GET', url, None)
+        return response.content
+
+    async def read_dataset_contents_binary(self, url):
+        return await self._send_request('GET', url, _read_binary)
+
+    async def read_dataset_contents_text(self, url):
+        return await self._send_request('GET', url, _read_text)
+
+    async def upload_dataset(self, workspace_id, name, description,
+                             data_type_id, raw_data, family_id,
+                             max_concurrency=1):
+        """
+        Uploads raw_data in blocks of CHUNK_SIZE bytes, with up to
+        max_concurrency blocks in flight, and creates the dataset. The blocks
+        are sent as slices of raw_data, without copying it, so raw_data may
+        be any object supporting the buffer protocol. Text is uploaded encoded
+        as UTF-8.
+        """
+        view = _byte_view(raw_data)
+        total_blocks = (len(view) + self.CHUNK_SIZE - 1) // self.CHUNK_SIZE
+
+        api_path = self.UPLOAD_URI_FMI.format(workspace_id, data_type_id)
+        upload_result = await self._send_post_req(
+            api_path, data=b'', idempotent=False)
+        upload_id = upload_result["Id"]
+
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def send_block(block_id):
+            block_url = self.UPLOAD_CHUNK_URI_FMT.format(
+                workspace_id,
+                total_blocks, # number of blocks
+                block_id,
+                upload_id,
+                data_type_id,
+            )
+            data = view[block_id*self.CHUNK_SIZE:(block_id + 1)*self.CHUNK_SIZE]
+            async with slots:
+                await self._send_post_req(block_url, data=data, idempotent=True)
+
+        await asyncio.gather(*[send_block(block_id) for block_id in range(total_blocks)])
+
+        metadata = self._get_datasource_metadata(
+            name, description, data_type_id, family_id, upload_id)
+        api_path = self.DATASOURCES_URI_FMT.format(workspace_id)
+        try:
+            return await self._send_post_req(
+                api_path, json.dumps(metadata), self.CONTENT_TYPE_HEADER_VALUE_JSON,
+                idempotent=False)
+        except AzureMLConflictHttpError as e:
+            raise AzureMLConflictHttpError(
+                'A data set named "{}" already exists'.format(name),
+                e.status_code
+            )
+
+    async def _send_get_req(self, api_path):
+        return await self._send_request(
+            'GET',
+            urljoin(self._service_endpoint, api_path),
+            _read_json,
+            headers=self._get_headers(),
+        )
+
+    async def _send_post_req(self, api_path, data, content_type=None,
+                             idempotent=None):
+        return await self._send_request(
+            'POST',
+            urljoin(self._service_endpoint, api_path),
+            _read_json,
+            idempotent=idempotent,
+            data=data,
+            headers=self._get_headers(content_type),
+        )
+
+    async def _send_request(self, method, url, read, idempotent=None,
+                            **kwargs):
+        """
+        Sends a request over the pooled session, retrying it according to the
+        retry policy, and returns the result of the coroutine read(response).
+        Connection errors and timeouts are always retriable, unless the
+        request is not idempotent: it is then only retried if the connection
+        could not be established. If read is None, the response itself is
+        returned and the caller must read or release it. Raises
+        AzureMLHttpError for error status codes.
+        """
+        if idempotent is None:
+            idempotent = method in self.IDEMPOTENT_METHODS
+        session = self._get_session()
+        attempt = 1
+        while True:
+            try:
+                response = await session.request(method, url, **kwargs)
+                try:
+                    if response.status >= 400:
+                        error = AzureMLHttpError(await response.text(), response.status)
+                        error.retry_after = _get_retry_after(response)
+                        raise error
+                    result = response if read is None else await read(response)
+                except:
+                    response.release()
+                    raise
+                if read is not None:
+                    response.release()
+                return result
+            except Exception as e:
+                if attempt >= self._retry_policy.max_attempts or not (
+                        self._is_retriable(e, idempotent)):
+                    raise
+                await asyncio.sleep(self._retry_policy.get_backoff(attempt, e))
+                attempt += 1
+
+    def _is_retriable(self, error, idempotent):
+        if not idempotent:
+            return isinstance(error, aiohttp.ClientConnectorError) or \
+                self._retry_policy.is_unsent(error)
+        return isinstance(error, _CONNECTION_ERRORS) or \
+            self._retry_policy.is_retriable(error)
+
+    def _get_session(self):
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                force_close=not self._keep_alive,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self._timeout)
+        return self._session
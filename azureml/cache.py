@@ -0,0 +1,264 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation
+# All rights reserved.
+#
+# MIT License:
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#--------------------------------------------------------------------------
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+from os import path
+
+from azureml.errors import AzureMLError
+
+try:
+    from os import replace as _replace_file
+except ImportError:
+    from os import rename as _replace_file
+
+_clock = getattr(time, 'monotonic', time.time)
+
+
+class DatasetCache(object):
+    """
+    Size-bounded on-disk cache for the contents of datasets.
+
+    The versions of a dataset are immutable, so the contents are cached for
+    the dataset id, size and creation date, and never need to be invalidated.
+    When the total size of the cache exceeds max_size, the least recently
+    used contents are evicted. The cache directory can be shared by several
+    processes.
+
+    Pass the cache to a workspace to enable it:
+
+    >>> ws = Workspace(cache=DatasetCache(max_size=0x80000000))
+    """
+    DEFAULT_MAX_SIZE = 0x40000000
+    COPY_BUFFER_SIZE = 0x100000
+
+    def __init__(self, directory=None, max_size=None):
+        """
+        Parameters
+        ----------
+        directory : str, optional
+            Directory to store the cached contents in.
+            Defaults to ~/.azureml/cache.
+        max_size : int, optional
+            Maximum total size of the cached contents, in bytes.
+            Defaults to 1 GB.
+        """
+        if directory is None:
+            directory = path.expanduser('~/.azureml/cache')
+        if not path.isdir(directory):
+            os.makedirs(directory)
+
+        self.directory = directory
+        self.max_size = self.DEFAULT_MAX_SIZE if max_size is None else max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<DatasetCache {0}: {1} hits, {2} misses, {3} evictions>'.format(
+            self.directory, self.hits, self.misses, self.evictions)
+
+    @property
+    def size(self):
+        """Total size of the cached contents, in bytes."""
+        return sum(size for _, size, _ in self._get_entries())
+
+    def open(self, key):
+        """Open and return the cached contents for key, or None on a miss."""
+        file_path = self._get_path(key)
+        try:
+            cached = open(file_path, 'rb')
+        except EnvironmentError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # the modification time orders the entries for eviction
+        try:
+            os.utime(file_path, None)
+        except EnvironmentError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return cached
+
+    def add(self, key, reader, size=None):
+        """
+        Copy the contents of the reader to the cache, and open and return them.
+        The contents are written to a temporary file first, so that other
+        processes never see a partially written entry. If size is given, the
+        contents are only cached if the reader returned exactly size bytes;
+        AzureMLError is raised otherwise.
+        """
+        file_path = self._get_path(key)
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, prefix='.')
+        try:
+            with os.fdopen(handle, 'wb') as temp_file:
+                shutil.copyfileobj(reader, temp_file, self.COPY_BUFFER_SIZE)
+                written = temp_file.tell()
+            if size is not None and written != size:
+                raise AzureMLError(
+                    'Read {0} of {1} bytes of the dataset contents'.format(
+                        written, size))
+            _replace_file(temp_path, file_path)
+        except:
+            if path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        cached = open(file_path, 'rb')
+        self._evict(file_path)
+        return cached
+
+    def clear(self):
+        """Remove all the cached contents."""
+        for _, _, file_path in self._get_entries():
+            try:
+                os.remove(file_path)
+            except EnvironmentError:
+                pass
+
+    def _get_path(self, key):
+        name = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return path.join(self.directory, name)
+
+    def _get_entries(self):
+        """Returns (modification time, size, path) for each cached entry."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.startswith('.'):
+                # being written
+                continue
+            file_path = path.join(self.directory, name)
+            try:
+                stat = os.stat(file_path)
+            except EnvironmentError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, file_path))
+        return entries
+
+    def _evict(self, keep_path):
+        """Removes the least recently used entries until max_size is met."""
+        entries = sorted(self._get_entries())
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, file_path in entries:
+            if total_size <= self.max_size:
+                break
+            if file_path == keep_path:
+                continue
+            try:
+                os.remove(file_path)
+            except EnvironmentError:
+                # in use, or already evicted by another process
+                continue
+            total_size -= size
+            with self._lock:
+                self.evictions += 1
+
+
+class _MetadataCache(object):
+    """
+    INTERNAL USE ONLY. Caches the result of a listing request for ttl
+    seconds, or until invalidated.
+
+    Concurrent callers that find the cache expired wait for a single
+    request instead of each issuing their own.
+    """
+
+    def __init__(self, fetch, ttl):
+        """
+        Parameters
+        ----------
+        fetch : callable
+            Function without arguments which issues the request.
+        ttl : float
+            Number of seconds the result is reused for. 0 to never reuse it,
+            None to reuse it until invalidated.
+        """
+        self._fetch = fetch
+        self.ttl = ttl
+        self._value = None
+        self._expires = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        if self.ttl == 0:
+            return self._fetch()
+
+        with self._lock:
+            if self._value is None or \
+                    (self._expires is not None and _clock() >= self._expires):
+                self._value = self._fetch()
+                if self.ttl is not None:
+                    self._expires = _clock() + self.ttl
+            return self._value
+
+    def invalidate(self):
+        with self._lock:
+            self._value = None
+
+
+class _Catalog(object):
+    """
+    INTERNAL USE ONLY. Listing of metadata, with hash indexes over some of
+    its keys.
+    """
+
+    def __init__(self, items, keys):
+        """
+        Parameters
+        ----------
+        items : list of dict
+            Metadata of the items, in listing order.
+        keys : iterable of str
+            Keys of the metadata to index the items by.
+        """
+        self.items = items
+        self._indexes = {}
+        for key in keys:
+            index = {}
+            for item in items:
+                index.setdefault(item.get(key), []).append(item)
+            self._indexes[key] = index
+        self._views = {}
+
+    def find(self, key, value):
+        """Returns the items whose metadata key is value, in listing order."""
+        return self._indexes[key].get(value, [])
+
+    def view(self, name, predicate):
+        """
+        Returns the items that satisfy predicate, in listing order. The
+        result is computed once and reused for the same name.
+        """
+        items = self._views.get(name)
+        if items is None:
+            items = self._views[name] = [item for item in self.items if predicate(item)]
+        return items
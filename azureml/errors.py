@@ -41,12 +41,15 @@ class AzureMLHttpError(AzureMLError):
     def __init__(self, message, status_code):
         super(AzureMLHttpError, self).__init__(message)
         self.status_code = status_code
+        self.retry_after = None
 
     def __new__(cls, message, status_code, *args, **kwargs):
         if status_code == 409:
             cls = AzureMLConflictHttpError
         elif status_code == 401:
             cls = AzureMLUnauthorizedError
+        elif status_code in _TRANSIENT_STATUS_CODES:
+            cls = AzureMLTransientHttpError
         return AzureMLError.__new__(cls, message, status_code, *args, **kwargs)
 
 
@@ -62,6 +65,14 @@ class AzureMLConflictHttpError(AzureMLHttpError):
     def __init__(self, message, status_code):
         super(AzureMLConflictHttpError, self).__init__(message, status_code)
 
+
+_TRANSIENT_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
+class AzureMLTransientHttpError(AzureMLHttpError):
+    '''Transient error from Azure ML REST API, the request may be retried.'''
+    def __init__(self, message, status_code):
+        super(AzureMLTransientHttpError, self).__init__(message, status_code)
+
 class UnsupportedDatasetTypeError(AzureMLError):
     '''Dataset type is not supported.'''
     def __init__(self, data_type_id):
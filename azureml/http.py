@@ -23,8 +23,20 @@
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #--------------------------------------------------------------------------
 
+import io
 import json
+import mmap
+import os
+import random
+import tempfile
+import threading
+import time
 import requests
+from collections import deque
+from itertools import chain, islice
+from multiprocessing.pool import ThreadPool
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.exceptions import NewConnectionError
 from azureml.errors import AzureMLConflictHttpError
 
 try:
@@ -32,18 +44,399 @@ try:
 except ImportError:
     from urllib.parse import urljoin
 
+try:
+    from os import replace as _replace_file
+except ImportError:
+    from os import rename as _replace_file
+
+from email.utils import mktime_tz, parsedate_tz
+
+try:
+    _TEXT_TYPE = unicode
+except NameError:
+    _TEXT_TYPE = str
+
 from azureml.errors import (
+    AzureMLError,
     AzureMLHttpError,
+    AzureMLTransientHttpError,
+    _TRANSIENT_STATUS_CODES,
 )
 
 __author__ = 'Microsoft Corp. <ptvshelp@microsoft.com>'
 __version__ = '0.2.7'
 
 
-class _RestClient(object):
+class RetryPolicy(object):
+    """
+    Policy for retrying the REST API and storage requests of a workspace,
+    and the calls of published services.
+
+    A request is retried when it fails with a connection error or timeout,
+    or with an AzureMLTransientHttpError (status code 408, 429 or 5xx). Other
+    errors with a status_code attribute, such as the errors of published
+    services, are retried for the same status codes. Each request is retried
+    on its own: a failed block of an upload is sent again without restarting
+    the whole upload.
+
+    Requests that create a resource are not idempotent, since the server may
+    have created it before the request failed. They are only retried when
+    the connection to the server could not be established.
+
+    Override is_retriable(), is_unsent() and get_backoff() to customize the
+    policy.
+    """
+
+    def __init__(self, max_attempts=4, backoff_factor=0.5, max_backoff=30.0,
+                 jitter=True):
+        """
+        Parameters
+        ----------
+        max_attempts : int
+            Maximum number of attempts for a request, including the first one.
+            Use 1 to disable retries.
+        backoff_factor : float
+            Delay in seconds before the first retry. The delay doubles with
+            every attempt.
+        max_backoff : float
+            Maximum delay in seconds between two attempts.
+        jitter : bool
+            True to wait a random delay between 0 and the computed backoff,
+            so that concurrent requests do not all retry at the same time.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+
+    def is_retriable(self, error):
+        """Return True if the request that raised error can be retried."""
+        if isinstance(error, AzureMLHttpError):
+            return isinstance(error, AzureMLTransientHttpError)
+        if getattr(error, 'status_code', None) is not None:
+            return error.status_code in _TRANSIENT_STATUS_CODES
+        return isinstance(error, (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ))
+
+    def is_unsent(self, error):
+        """
+        Return True if error shows that the request never reached the server,
+        so that even a request that is not idempotent can be retried.
+        """
+        if isinstance(error, requests.ConnectTimeout):
+            return True
+        if isinstance(error, requests.ConnectionError) and error.args:
+            # requests wraps the urllib3 error, whose reason tells whether
+            # the connection could be established
+            reason = getattr(error.args[0], 'reason', None)
+            return isinstance(reason, NewConnectionError)
+        return False
+
+    def get_backoff(self, attempt, error):
+        """
+        Return the delay in seconds before the next attempt, given the number
+        of attempts made so far. The Retry-After delay sent by the server,
+        when there is one, takes precedence.
+        """
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after is not None:
+            return retry_after
+
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
+
+    def execute(self, func, *args, **kwargs):
+        """Call func, retrying it as long as the policy allows."""
+        return self._execute(self.is_retriable, func, args, kwargs)
+
+    def execute_unsafe(self, func, *args, **kwargs):
+        """
+        Call func, which sends a request that is not idempotent, retrying it
+        only when is_unsent() shows that the request never reached the server.
+        """
+        return self._execute(self.is_unsent, func, args, kwargs)
+
+    def _execute(self, is_retriable, func, args, kwargs):
+        attempt = 1
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_attempts or not is_retriable(e):
+                    raise
+                time.sleep(self.get_backoff(attempt, e))
+                attempt += 1
+
+
+def _get_retry_after(response):
+    """Returns the Retry-After delay of the response in seconds, or None."""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        date = parsedate_tz(value)
+        if date is None:
+            return None
+        return max(0, mktime_tz(date) - time.time())
+
+
+class _BlockReader(object):
+    """
+    Read-only file-like object over a block of a larger buffer, used as a
+    request body so that the block is sent without being copied first.
+    """
+
+    def __init__(self, view):
+        self._view = view
+        self._position = 0
+
+    def __len__(self):
+        return len(self._view)
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self._position
+        elif whence == 2:
+            offset += len(self._view)
+        self._position = offset
+        return self._position
+
+    def read(self, size=-1):
+        start = self._position
+        if size is None or size < 0:
+            end = len(self._view)
+        else:
+            end = min(start + size, len(self._view))
+        self._position = end
+        return self._view[start:end].tobytes()
+
+    def close(self):
+        """Releases the block, so that the buffer it is part of can be closed."""
+        if hasattr(self._view, 'release'):
+            self._view.release()
+
+
+class _ChunksReader(io.RawIOBase):
+    """Read-only stream over an iterable of bytes objects."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._chunk = memoryview(b'')
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not len(self._chunk):
+            try:
+                self._chunk = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+    def close(self):
+        if not self.closed and hasattr(self._chunks, 'close'):
+            self._chunks.close()
+        super(_ChunksReader, self).close()
+
+
+def _map_file(file):
+    """
+    Returns a memoryview over a read-only memory map of the file, or None if
+    the file is not stored on disk, is empty or cannot be mapped.
+    """
+    try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, EnvironmentError, ValueError):
+        return None
+    try:
+        return memoryview(mapped)
+    except TypeError:
+        # memoryview does not support mmap objects on Python 2
+        mapped.close()
+        return None
+
+
+def _byte_view(data):
+    """
+    Returns a flat memoryview of the bytes of a buffer, or None if memoryview
+    does not support the object. Text is encoded as UTF-8, and a buffer that
+    is not contiguous is copied.
+    """
+    if isinstance(data, _TEXT_TYPE):
+        data = data.encode('utf-8')
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return None
+    if not getattr(view, 'c_contiguous', True):
+        return memoryview(view.tobytes())
+    if view.ndim != 1 or view.itemsize != 1:
+        view = view.cast('B')
+    return view
+
+
+def _close_block(data):
+    """Closes data if it is a _BlockReader, releasing its block."""
+    if isinstance(data, _BlockReader):
+        data.close()
+
+
+def _unmap_file(view):
+    mapped = view.obj
+    try:
+        view.release()
+        mapped.close()
+    except BufferError:
+        # a block is still referenced, for example by the traceback of a
+        # failed upload; the map is closed when it is garbage collected
+        pass
+
+
+def _rechunk(pieces, block_size, size):
+    """
+    Regroups an iterable of bytes of any length into blocks of block_size
+    bytes (the last one may be shorter), checking that they add up to size.
+    """
+    total = 0
+    pending = bytearray()
+    for piece in pieces:
+        total += len(piece)
+        if total > size:
+            raise ValueError('The stream is longer than {0} bytes'.format(size))
+        pending.extend(piece)
+        while len(pending) >= block_size:
+            yield bytes(pending[:block_size])
+            del pending[:block_size]
+    if total != size:
+        raise ValueError(
+            'The stream is {0} bytes long, expected {1}'.format(total, size))
+    if pending:
+        yield bytes(pending)
+
+
+class _UploadJournal(object):
+    """
+    Records the upload id and the acknowledged blocks of a dataset upload in
+    a small JSON file, so that an interrupted upload can be resumed by sending
+    only its missing blocks.
+
+    The journal is only resumed for the same workspace, dataset name, data
+    type, size and block size. It is up to the caller to upload the same data.
+    """
+
+    def __init__(self, path, upload):
+        self.path = path
+        self.upload = upload
+        self.upload_id = None
+        self.blocks = set()
+        self._lock = threading.Lock()
+
+        try:
+            with open(path, 'r') as journal_file:
+                state = json.load(journal_file)
+        except (EnvironmentError, ValueError):
+            return
+
+        if state.get('upload') == upload:
+            self.upload_id = state['upload_id']
+            self.blocks = set(state['blocks'])
+
+    def start(self, upload_id):
+        self.upload_id = upload_id
+        self.blocks = set()
+        with self._lock:
+            self._save()
+
+    def acknowledge(self, block_id):
+        with self._lock:
+            self.blocks.add(block_id)
+            self._save()
+
+    def delete(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _save(self):
+        state = {
+            'upload': self.upload,
+            'upload_id': self.upload_id,
+            'blocks': sorted(self.blocks),
+        }
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as journal_file:
+            json.dump(state, journal_file)
+        _replace_file(temp_path, self.path)
+
+
+class _TaskPool(object):
+    """
+    Runs tasks on a pool of threads, with at most max_workers tasks pending or
+    running at any time. submit() blocks until a slot is free, so tasks can be
+    fed from a generator without reading it ahead of the workers.
+
+    The first error raised by a task stops the submission of new tasks, and is
+    raised again by submit() or join().
+    """
+
+    def __init__(self, max_workers):
+        self._pool = ThreadPool(max_workers)
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._errors = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.join()
+        else:
+            self._pool.terminate()
+
+    def submit(self, func, *args):
+        self._slots.acquire()
+        if self._errors:
+            self._slots.release()
+            raise self._errors[0]
+        self._pool.apply_async(self._run, (func, args))
+
+    def join(self):
+        self._pool.close()
+        self._pool.join()
+        if self._errors:
+            raise self._errors[0]
+
+    def _run(self, func, args):
+        try:
+            func(*args)
+        except Exception as e:
+            self._errors.append(e)
+        finally:
+            self._slots.release()
+
+
+class _RestApi(object):
+    """
+    URLs and headers of the Azure ML REST API, shared by _RestClient and the
+    asynchronous client of azureml.aio. Subclasses set _access_token.
+    """
     SERVICE_ROOT = 'api/'
     INTERMEDIATE_DATASET_URI_FMT = SERVICE_ROOT + 'workspaces/{0}/experiments/{1}/outputdata/{2}/{3}'
     EXPERIMENTS_URI_FMT = SERVICE_ROOT + 'workspaces/{0}/experiments'
+    EXPERIMENT_URI_FMT = SERVICE_ROOT + 'workspaces/{0}/experiments/{1}'
     DATASOURCES_URI_FMT = SERVICE_ROOT + 'workspaces/{0}/datasources'
     DATASOURCE_URI_FMT = SERVICE_ROOT + 'workspaces/{0}/datasources/{1}'
     UPLOAD_URI_FMI = SERVICE_ROOT + 'resourceuploads/workspaces/{0}/?userStorage=true&dataTypeId={1}'
@@ -57,16 +450,90 @@ class _RestClient(object):
     DEFAULT_OWNER = 'Python SDK'
     USER_AGENT_HEADER_NAME = 'User-Agent'
     USER_AGENT_HEADER_VALUE = 'pyazureml/' + __version__
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+    # seconds to wait for a connection, then for each read of a response
+    DEFAULT_TIMEOUT = (10, 120)
+
+    def _get_datasource_metadata(self, name, description, data_type_id,
+                                 family_id, upload_id):
+        return {
+            "DataSource": {
+                "Name": name,
+                "DataTypeId":data_type_id,
+                "Description":description,
+                "FamilyId":family_id,
+                "Owner": self.DEFAULT_OWNER,
+                "SourceOrigin":"FromResourceUpload"
+            },
+            "UploadId": upload_id,
+            "UploadedFromFileName":"",
+            "ClientPoll": True
+        }
+
+    def _get_headers(self, content_type=None):
+        headers = {
+            self.USER_AGENT_HEADER_NAME: self.USER_AGENT_HEADER_VALUE,
+            self.CONTENT_TYPE_HEADER_NAME: self.CONTENT_TYPE_HEADER_VALUE_JSON,
+            self.SESSION_ID_HEADER_NAME: self.SESSION_ID_HEADER_VALUE,
+            self.ACCESS_TOKEN_HEADER_NAME: self._access_token
+        }
+        if content_type:
+            headers[self.CONTENT_TYPE_HEADER_NAME] = content_type
+        return headers
+
 
-    def __init__(self, service_endpoint, access_token):
+class _RestClient(_RestApi):
+    CONNECTION_HEADER_NAME = 'Connection'
+    CONNECTION_HEADER_VALUE_CLOSE = 'close'
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+    RANGE_HEADER_NAME = 'Range'
+    CONTENT_RANGE_HEADER_NAME = 'Content-Range'
+    DOWNLOAD_CONNECTIONS = 4
+    DOWNLOAD_RANGE_SIZE = 0x800000
+    PARALLEL_DOWNLOAD_THRESHOLD = 0x2000000
+    GET_MANY_CONNECTIONS = 4
+    STREAM_CHUNK_SIZE = 0x100000
+    REJECTED_UPLOAD_STATUS_CODES = (400, 404, 410)
+
+    def __init__(self, service_endpoint, access_token, pool_connections=None,
+                 pool_maxsize=None, pool_block=False, keep_alive=True,
+                 retry_policy=None, timeout=None):
         self._service_endpoint = service_endpoint
         self._access_token = access_token
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._timeout = timeout or self.DEFAULT_TIMEOUT
+        self._session = self._create_session(
+            pool_connections or self.DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize or self.DEFAULT_POOL_MAXSIZE,
+            pool_block,
+            keep_alive,
+        )
+
+    def close(self):
+        """Closes the pooled connections."""
+        self._session.close()
 
     def get_experiments(self, workspace_id):
         """Runs HTTP GET request to retrieve the list of experiments."""
         api_path = self.EXPERIMENTS_URI_FMT.format(workspace_id)
         return self._send_get_req(api_path)
 
+    def get_experiment(self, workspace_id, experiment_id):
+        """Runs HTTP GET request to retrieve a single experiment."""
+        api_path = self.EXPERIMENT_URI_FMT.format(workspace_id, experiment_id)
+        return self._send_get_req(api_path)
+
+    def get_experiments_by_id(self, workspace_id, experiment_ids,
+                              max_connections=None):
+        """
+        Runs HTTP GET requests over up to max_connections connections in
+        parallel, to retrieve several experiments in the order of their ids.
+        Returns None in place of the experiments that do not exist.
+        """
+        return self._get_many(
+            self.get_experiment, workspace_id, experiment_ids, max_connections)
+
     def get_datasets(self, workspace_id):
         """Runs HTTP GET request to retrieve the list of datasets."""
         api_path = self.DATASOURCES_URI_FMT.format(workspace_id)
@@ -77,6 +544,37 @@ class _RestClient(object):
         api_path = self.DATASOURCE_URI_FMT.format(workspace_id, dataset_id)
         return self._send_get_req(api_path)
 
+    def get_datasets_by_id(self, workspace_id, dataset_ids,
+                           max_connections=None):
+        """
+        Runs HTTP GET requests over up to max_connections connections in
+        parallel, to retrieve several datasets in the order of their ids.
+        Returns None in place of the datasets that do not exist.
+        """
+        return self._get_many(
+            self.get_dataset, workspace_id, dataset_ids, max_connections)
+
+    def _get_many(self, get, workspace_id, ids, max_connections):
+        def get_or_none(id):
+            try:
+                return get(workspace_id, id)
+            except AzureMLHttpError as e:
+                if e.status_code != 404:
+                    raise
+                return None
+
+        ids = list(ids)
+        max_connections = min(
+            max_connections or self.GET_MANY_CONNECTIONS, len(ids))
+        if max_connections <= 1:
+            return [get_or_none(id) for id in ids]
+
+        pool = ThreadPool(max_connections)
+        try:
+            return pool.map(get_or_none, ids)
+        finally:
+            pool.terminate()
+
     def open_intermediate_dataset_contents(self, workspace_id, experiment_id,
                                            node_id, port_name):
         return self._get_intermediate_dataset_contents(
@@ -106,108 +604,421 @@ class _RestClient(object):
             port_name,
             stream=False).text
 
+    def stream_intermediate_dataset_contents(self, workspace_id,
+                                             experiment_id, node_id,
+                                             port_name):
+        """
+        Returns a stream over the contents as they are downloaded, decoded
+        from their transfer encoding. Closing the stream closes the response.
+        """
+        response = self._get_intermediate_dataset_contents(
+            workspace_id,
+            experiment_id,
+            node_id,
+            port_name,
+            stream=True)
+        return io.BufferedReader(_ChunksReader(
+            self._iter_response_content(response)))
+
+    def _iter_response_content(self, response):
+        try:
+            for chunk in response.iter_content(self.STREAM_CHUNK_SIZE):
+                yield chunk
+        finally:
+            response.close()
+
     def _get_intermediate_dataset_contents(self, workspace_id, experiment_id,
                                            node_id, port_name, stream):
         api_path = self.INTERMEDIATE_DATASET_URI_FMT.format(
             workspace_id, experiment_id, node_id, port_name)
-        response = requests.get(
-            url=urljoin(self._service_endpoint, api_path),
+        response = self._send_request(
+            'GET',
+            urljoin(self._service_endpoint, api_path),
             headers=self._get_headers(),
             stream=stream,
         )
         return response
 
-    def open_dataset_contents(self, url):
-        response = requests.get(url, stream=True)
+    def open_dataset_contents(self, url, size=None, max_connections=None):
+        if self._is_parallel_download(size, max_connections):
+            ranges = self._iter_dataset_contents_ranges(
+                url, max_connections or self.DOWNLOAD_CONNECTIONS)
+            return io.BufferedReader(_ChunksReader(ranges))
+
+        response = self._send_request('GET', url, stream=True)
         return response.raw
 
-    def read_dataset_contents_binary(self, url):
-        response = requests.get(url)
+    def read_dataset_contents_binary(self, url, size=None,
+                                     max_connections=None):
+        if self._is_parallel_download(size, max_connections):
+            return b''.join(self._iter_dataset_contents_ranges(
+                url, max_connections or self.DOWNLOAD_CONNECTIONS))
+
+        response = self._send_request('GET', url)
         return response.content
 
     def read_dataset_contents_text(self, url):
-        response = requests.get(url)
+        response = self._send_request('GET', url)
         return response.text
 
+    def _is_parallel_download(self, size, max_connections):
+        """
+        Returns True if contents of the specified size are large enough to be
+        downloaded as several byte ranges in parallel.
+        """
+        if max_connections is None:
+            max_connections = self.DOWNLOAD_CONNECTIONS
+        return size is not None and max_connections > 1 and \
+            size >= self.PARALLEL_DOWNLOAD_THRESHOLD
+
+    def _iter_dataset_contents_ranges(self, url, max_connections):
+        """
+        Downloads the blob at url as consecutive byte ranges, with up to
+        max_connections ranges in flight, and yields their contents in order.
+        The total size comes from the Content-Range of the first range.
+        """
+        first = self._send_request(
+            'GET', url, headers=self._get_range_headers(0))
+        if first.status_code != 206:
+            # ranges are not supported, the first response has everything
+            yield first.content
+            return
+
+        total_size = int(first.headers[self.CONTENT_RANGE_HEADER_NAME].rsplit('/', 1)[1])
+        offsets = iter(range(len(first.content), total_size, self.DOWNLOAD_RANGE_SIZE))
+
+        pool = ThreadPool(max_connections)
+        try:
+            pending = deque(
+                pool.apply_async(self._read_dataset_contents_range, (url, offset))
+                for offset in islice(offsets, max_connections)
+            )
+            yield first.content
+            first = None
+
+            while pending:
+                content = pending.popleft().get()
+                for offset in islice(offsets, 1):
+                    pending.append(pool.apply_async(
+                        self._read_dataset_contents_range, (url, offset)))
+                yield content
+        finally:
+            pool.terminate()
+
+    def _read_dataset_contents_range(self, url, offset):
+        response = self._send_request(
+            'GET', url, headers=self._get_range_headers(offset))
+        if response.status_code != 206:
+            raise AzureMLError(
+                'Expected a partial response, got status code {0}'.format(
+                    response.status_code))
+        return response.content
+
+    def _get_range_headers(self, offset):
+        return {
+            self.RANGE_HEADER_NAME: 'bytes={0}-{1}'.format(
+                offset, offset + self.DOWNLOAD_RANGE_SIZE - 1),
+        }
+
     def upload_dataset(self, workspace_id, name, description, data_type_id,
-                       raw_data, family_id):
+                       raw_data, family_id, max_concurrency=1,
+                       journal_path=None):
+        """
+        Uploads raw_data, which may be any object supporting the buffer
+        protocol, such as bytes, bytearray, memoryview or mmap. The blocks are
+        sent as slices of a memoryview, without being copied. Text is uploaded
+        encoded as UTF-8.
+        """
+        view = _byte_view(raw_data)
+        if view is None:
+            # memoryview does not support mmap objects on Python 2
+            view = memoryview(raw_data[:])
+
+        # Upload the data in chunks...
+        total_chunks = int((len(view) + (self.CHUNK_SIZE-1)) / self.CHUNK_SIZE)
+        chunks = (
+            (chunk, _BlockReader(view[chunk*self.CHUNK_SIZE:(chunk + 1)*self.CHUNK_SIZE]))
+            for chunk in range(total_chunks)
+        )
+        return self._upload_dataset_blocks(
+            workspace_id, name, description, data_type_id, len(view),
+            total_chunks, chunks, family_id, max_concurrency, journal_path)
+
+    def upload_dataset_from_file(self, workspace_id, name, description,
+                                 data_type_id, file, family_id,
+                                 max_concurrency=1, journal_path=None):
+        """
+        Uploads the contents of a file object opened in binary mode. Files
+        stored on disk are memory mapped and sent one block at a time; other
+        file objects are read as a stream.
+        """
+        view = _map_file(file)
+        if view is None:
+            pieces = iter(lambda: file.read(self.CHUNK_SIZE), b'')
+            return self.upload_dataset_from_stream(
+                workspace_id, name, description, data_type_id, pieces, None,
+                family_id, max_concurrency, journal_path)
+
+        try:
+            total_chunks = int((len(view) + (self.CHUNK_SIZE-1)) / self.CHUNK_SIZE)
+            chunks = (
+                (chunk, _BlockReader(view[chunk*self.CHUNK_SIZE:(chunk + 1)*self.CHUNK_SIZE]))
+                for chunk in range(total_chunks)
+            )
+            return self._upload_dataset_blocks(
+                workspace_id, name, description, data_type_id, len(view),
+                total_chunks, chunks, family_id, max_concurrency,
+                journal_path)
+        finally:
+            _unmap_file(view)
+
+    def upload_dataset_from_stream(self, workspace_id, name, description,
+                                   data_type_id, stream, size, family_id,
+                                   max_concurrency=1, journal_path=None):
+        """
+        Uploads an iterable of bytes, holding at most one block in memory.
+        Every block request includes the total number of blocks, so a
+        stream of unknown size is first spooled to a temporary file.
+        """
+        if size is None:
+            with tempfile.TemporaryFile() as spool:
+                for piece in stream:
+                    spool.write(piece)
+                if spool.tell() == 0:
+                    return self.upload_dataset(
+                        workspace_id, name, description, data_type_id, b'',
+                        family_id, max_concurrency, journal_path)
+                spool.flush()
+                return self.upload_dataset_from_file(
+                    workspace_id, name, description, data_type_id, spool,
+                    family_id, max_concurrency, journal_path)
+
+        total_chunks = int((size + (self.CHUNK_SIZE-1)) / self.CHUNK_SIZE)
+        chunks = enumerate(_rechunk(stream, self.CHUNK_SIZE, size))
+        return self._upload_dataset_blocks(
+            workspace_id, name, description, data_type_id, size,
+            total_chunks, chunks, family_id, max_concurrency, journal_path)
+
+    def _upload_dataset_blocks(self, workspace_id, name, description,
+                               data_type_id, size, total_blocks, blocks,
+                               family_id, max_concurrency, journal_path):
+        journal = None
+        if journal_path is not None:
+            journal = _UploadJournal(journal_path, {
+                'workspace_id': workspace_id,
+                'name': name,
+                'data_type_id': data_type_id,
+                'size': size,
+                'block_size': self.CHUNK_SIZE,
+            })
+
+        if journal is not None and journal.upload_id is not None:
+            blocks, datasource_id = self._resume_upload(
+                workspace_id, name, description, data_type_id, total_blocks,
+                blocks, family_id, max_concurrency, journal)
+            if datasource_id is not None:
+                return datasource_id
+
         # uploading data is a two step process. First we upload the raw data
         api_path = self.UPLOAD_URI_FMI.format(workspace_id, data_type_id)
-        upload_result = self._send_post_req(api_path, data=b'')
+        upload_result = self._send_post_req(api_path, data=b'', idempotent=False)
 
         # now get the id that was generated
         upload_id = upload_result["Id"]
+        if journal is not None:
+            journal.start(upload_id)
 
-        # Upload the data in chunks...
-        total_chunks = int((len(raw_data) + (self.CHUNK_SIZE-1)) / self.CHUNK_SIZE)
-        for chunk in range(total_chunks):
-            chunk_url = self.UPLOAD_CHUNK_URI_FMT.format(
-                workspace_id,
-                total_chunks, # number of blocks
-                chunk, # block id
-                upload_id,
-                data_type_id,
-            )
-            chunk_data = raw_data[chunk*self.CHUNK_SIZE:(chunk + 1)*self.CHUNK_SIZE]
-            self._send_post_req(chunk_url, data=chunk_data)
+        self._upload_blocks(workspace_id, data_type_id, upload_id,
+                            total_blocks, blocks, max_concurrency, journal)
 
-        # use that to construct the DataSource metadata
-        metadata = {
-            "DataSource": {
-                "Name": name,
-                "DataTypeId":data_type_id,
-                "Description":description,
-                "FamilyId":family_id,
-                "Owner": self.DEFAULT_OWNER,
-                "SourceOrigin":"FromResourceUpload"
-            },
-            "UploadId": upload_id,
-            "UploadedFromFileName":"",
-            "ClientPoll": True
-        }
+        return self._create_datasource(workspace_id, name, description,
+                                       data_type_id, family_id, upload_id,
+                                       journal)
+
+    def _resume_upload(self, workspace_id, name, description, data_type_id,
+                       total_blocks, blocks, family_id, max_concurrency,
+                       journal):
+        """
+        Resumes the interrupted upload recorded by the journal, sending only
+        its missing blocks. Returns (None, datasource id) once the dataset is
+        created.
+
+        The first block is sent again, or the dataset created if there is no
+        block, to tell whether the server still knows the journaled upload id.
+        If it is rejected, the journal is discarded and (blocks, None) is
+        returned, where blocks yields every block again for a fresh upload.
+        Only the first block is read until then, and the acknowledged blocks
+        are let go of as they are read, so a resumed upload holds no more
+        blocks in memory than a fresh one.
+        """
+        upload_id = journal.upload_id
+        acknowledged = set(journal.blocks)
+        blocks = iter(blocks)
+        first = next(blocks, None)
 
         try:
-            api_path = self.DATASOURCES_URI_FMT.format(workspace_id)
+            if first is None:
+                return None, self._create_datasource(
+                    workspace_id, name, description, data_type_id, family_id,
+                    upload_id, journal)
+            self._send_block(workspace_id, data_type_id, upload_id,
+                             total_blocks, *first)
+        except AzureMLHttpError as e:
+            if e.status_code not in self.REJECTED_UPLOAD_STATUS_CODES:
+                raise
+            journal.delete()
+            if first is None:
+                return iter(()), None
+            return chain([first], blocks), None
+
+        _close_block(first[1])
+        journal.acknowledge(first[0])
+
+        def missing_blocks():
+            for block_id, data in blocks:
+                if block_id in acknowledged:
+                    _close_block(data)
+                else:
+                    yield block_id, data
+
+        self._upload_blocks(workspace_id, data_type_id, upload_id,
+                            total_blocks, missing_blocks(), max_concurrency,
+                            journal)
+
+        return None, self._create_datasource(
+            workspace_id, name, description, data_type_id, family_id,
+            upload_id, journal)
+
+    def _create_datasource(self, workspace_id, name, description,
+                           data_type_id, family_id, upload_id, journal=None):
+        # use the upload id to construct the DataSource metadata
+        metadata = self._get_datasource_metadata(
+            name, description, data_type_id, family_id, upload_id)
+
+        api_path = self.DATASOURCES_URI_FMT.format(workspace_id)
+        try:
+            datasource_id = self._send_post_req(
+                api_path, json.dumps(metadata),
+                self.CONTENT_TYPE_HEADER_VALUE_JSON, idempotent=False)
         except AzureMLConflictHttpError as e:
             raise AzureMLConflictHttpError(
-                'A data set named "{}" already exists'.format(name), 
+                'A data set named "{}" already exists'.format(name),
                 e.status_code
             )
 
-        datasource_id = self._send_post_req(
-            api_path, json.dumps(metadata), self.CONTENT_TYPE_HEADER_VALUE_JSON)
+        if journal is not None:
+            journal.delete()
         return datasource_id
 
+    def _upload_blocks(self, workspace_id, data_type_id, upload_id,
+                       total_blocks, blocks, max_concurrency, journal=None):
+        """
+        Uploads the (block id, data) pairs, with up to max_concurrency blocks
+        in flight. Blocks may complete in any order since each one carries its
+        id; this returns only once every block has been acknowledged, either
+        now or in the interrupted upload recorded by the journal.
+        """
+        acknowledged = set(journal.blocks) if journal is not None else set()
+
+        def send_block(block_id, data):
+            try:
+                self._send_block(workspace_id, data_type_id, upload_id,
+                                 total_blocks, block_id, data)
+            finally:
+                _close_block(data)
+            acknowledged.add(block_id)
+            if journal is not None:
+                journal.acknowledge(block_id)
+
+        if max_concurrency > 1:
+            with _TaskPool(max_concurrency) as pool:
+                for block_id, data in blocks:
+                    pool.submit(send_block, block_id, data)
+        else:
+            for block_id, data in blocks:
+                send_block(block_id, data)
+
+        if len(acknowledged) != total_blocks:
+            raise AzureMLError(
+                'Uploaded {0} of {1} blocks'.format(len(acknowledged), total_blocks))
+
+    def _send_block(self, workspace_id, data_type_id, upload_id, total_blocks,
+                    block_id, data):
+        block_url = self.UPLOAD_CHUNK_URI_FMT.format(
+            workspace_id,
+            total_blocks, # number of blocks
+            block_id,
+            upload_id,
+            data_type_id,
+        )
+        # a block is stored under its id, so sending it twice is harmless
+        self._send_post_req(block_url, data=data, idempotent=True)
+
     def _send_get_req(self, api_path):
-        response = requests.get(
-            url=urljoin(self._service_endpoint, api_path),
+        response = self._send_request(
+            'GET',
+            urljoin(self._service_endpoint, api_path),
             headers=self._get_headers()
         )
-
-        if response.status_code >= 400:
-            raise AzureMLHttpError(response.text, response.status_code)
-
         return response.json()
 
-    def _send_post_req(self, api_path, data, content_type=None):
-        response = requests.post(
-            url=urljoin(self._service_endpoint, api_path),
+    def _send_post_req(self, api_path, data, content_type=None,
+                       idempotent=None):
+        response = self._send_request(
+            'POST',
+            urljoin(self._service_endpoint, api_path),
+            idempotent=idempotent,
             data=data,
             headers=self._get_headers(content_type)
         )
+        return response.json()
 
-        if response.status_code >= 400:
-            raise AzureMLHttpError(response.text, response.status_code)
+    def _send_request(self, method, url, idempotent=None, **kwargs):
+        """
+        Sends a request over the pooled session, retrying it according to the
+        retry policy. Raises AzureMLHttpError for error status codes.
 
-        return response.json()
+        idempotent defaults to True for the methods in IDEMPOTENT_METHODS.
+        Requests that are not idempotent are only retried if they were never
+        sent. Every request times out after the timeout of the client.
+        """
+        if idempotent is None:
+            idempotent = method in self.IDEMPOTENT_METHODS
+        kwargs.setdefault('timeout', self._timeout)
 
-    def _get_headers(self, content_type=None):
-        headers = {
-            self.USER_AGENT_HEADER_NAME: self.USER_AGENT_HEADER_VALUE,
-            self.CONTENT_TYPE_HEADER_NAME: self.CONTENT_TYPE_HEADER_VALUE_JSON,
-            self.SESSION_ID_HEADER_NAME: self.SESSION_ID_HEADER_VALUE,
-            self.ACCESS_TOKEN_HEADER_NAME: self._access_token
-        }
-        if content_type:
-            headers[self.CONTENT_TYPE_HEADER_NAME] = content_type
-        return headers
+        def send():
+            body = kwargs.get('data')
+            if hasattr(body, 'seek'):
+                # rewind a block consumed by a previous attempt
+                body.seek(0)
+
+            response = self._session.request(method, url, **kwargs)
+            if response.status_code >= 400:
+                error = AzureMLHttpError(response.text, response.status_code)
+                error.retry_after = _get_retry_after(response)
+                raise error
+            return response
+
+        if idempotent:
+            return self._retry_policy.execute(send)
+        return self._retry_policy.execute_unsafe(send)
+
+    def _create_session(self, pool_connections, pool_maxsize, pool_block,
+                        keep_alive):
+        """
+        Creates the session shared by every request of this client.
+        pool_connections is the number of hosts to keep a pool for, and
+        pool_maxsize the number of connections kept open to each host.
+        """
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not keep_alive:
+            session.headers[self.CONNECTION_HEADER_NAME] = \
+                self.CONNECTION_HEADER_VALUE_CLOSE
+        return session
@@ -24,7 +24,12 @@
 #--------------------------------------------------------------------------
 
 from functools import partial
+from io import BufferedReader, BytesIO, RawIOBase
+from itertools import chain
+from multiprocessing import Pool, cpu_count
+from multiprocessing.pool import ThreadPool
 import codecs
+import re
 import pandas as pd
 
 from azureml.errors import (
@@ -34,6 +39,35 @@ from azureml.errors import (
 )
 
 
+_TXT_BLOCK_LINES = 0x10000
+_TXT_READ_SIZE = 0x400000
+
+_PARALLEL_ENGINE = 'parallel'
+_PARALLEL_BLOCK_SIZE = 0x800000
+_PARALLEL_BLOCK_ROWS = 0x10000
+
+_ARFF_RELATION = u'Unnamed'
+_ARFF_SPECIAL_CHARS = re.compile(u'[\\s,\'"%{}?\\\\]')
+_ARFF_QUOTED_VALUE = re.compile(
+    br"""(?:(?<=,)|^)(\s*)(?:'((?:[^'\\]|\\.)*)'|"((?:[^"\\]|\\.)*)"|(\?\?+)(?=[ \t]*(?:,|\r?\n|$)))""")
+_ARFF_QUESTION_MARKS = re.compile(br'(?:\\?\?)+\Z')
+_ARFF_COMMENT_LINE = re.compile(br'\n[ \t]*%')
+_ARFF_SPACED_DOUBLE_QUOTE = re.compile(br'[\n,][ \t]+"')
+_ARFF_ESCAPE = re.compile(br"\\(.)|'")
+_ARFF_DATE_FORMAT = (u"yyyy-MM-dd'T'HH:mm:ss", u'%Y-%m-%dT%H:%M:%S')
+_JAVA_DATE_FIELDS = {
+    u'yyyy': u'%Y',
+    u'yy': u'%y',
+    u'MM': u'%m',
+    u'dd': u'%d',
+    u'HH': u'%H',
+    u'mm': u'%M',
+    u'ss': u'%S',
+    u'SSS': u'%f',
+    u'Z': u'%z',
+}
+
+
 class DataTypeIds(object):
     """Constants for the known dataset data type id strings."""
     ARFF = 'ARFF'
@@ -44,43 +78,641 @@ class DataTypeIds(object):
     GenericTSVNoHeader = 'GenericTSVNoHeader'
 
 
-def _dataframe_to_csv(writer, dataframe, delimiter, with_header):
-    """serialize the dataframe with different delimiters"""
-    encoding_writer = codecs.getwriter('utf-8')(writer)
-    dataframe.to_csv(
-        path_or_buf=encoding_writer,
+def _dataframe_to_csv(writer, dataframe, delimiter, with_header,
+                      max_workers=None):
+    """
+    serialize the dataframe with different delimiters. If max_workers is
+    greater than 1, blocks of rows are formatted by a pool of processes and
+    written in order, the header with the first block only. The datetime and
+    timedelta columns are formatted beforehand, see _format_dates.
+    """
+    if not max_workers or max_workers < 2 or \
+            len(dataframe) <= _PARALLEL_BLOCK_ROWS:
+        encoding_writer = codecs.getwriter('utf-8')(writer)
+        dataframe.to_csv(
+            path_or_buf=encoding_writer,
+            sep=delimiter,
+            header=with_header,
+            index=False
+        )
+        return
+
+    dataframe = _format_dates(dataframe)
+    blocks = (
+        (dataframe.iloc[start:start + _PARALLEL_BLOCK_ROWS],
+         with_header and start == 0)
+        for start in range(0, len(dataframe), _PARALLEL_BLOCK_ROWS)
+    )
+    pool = Pool(max_workers)
+    try:
+        for data in pool.imap(partial(_csv_block, delimiter=delimiter), blocks):
+            writer.write(data)
+    finally:
+        pool.terminate()
+        pool.join()
+
+def _format_dates(dataframe):
+    """
+    Returns the dataframe with its datetime and timedelta columns replaced
+    by their values formatted by to_csv. to_csv picks the format of such a
+    column from all of its values, leaving out the time when every value is
+    at midnight for example, so blocks of rows formatted one at a time could
+    otherwise get different formats.
+    """
+    columns = [dataframe.iloc[:, i] for i in range(dataframe.shape[1])]
+    dates = [
+        i for i, column in enumerate(columns)
+        if pd.api.types.is_datetime64_any_dtype(column) or
+        pd.api.types.is_timedelta64_dtype(column)
+    ]
+    if not dates:
+        return dataframe
+
+    for i in dates:
+        # a single column csv has one value per line, the missing values
+        # being written as ""
+        values = columns[i].to_csv(index=False, header=False).splitlines()
+        columns[i] = pd.Series(
+            [u'' if value == u'""' else value for value in values],
+            index=columns[i].index, dtype=object)
+    result = pd.concat(columns, axis=1)
+    result.columns = dataframe.columns
+    return result
+
+def _csv_block(block, delimiter):
+    """Returns a block of rows formatted as csv, in a worker process."""
+    dataframe, with_header = block
+    return dataframe.to_csv(
         sep=delimiter,
         header=with_header,
         index=False
-    )
+    ).encode('utf-8')
+
+def _dataframe_to_txt(writer, dataframe, max_workers=None):
+    """
+    Writes each row as the concatenation of its values, one row per line.
+    The rows are joined a column at a time and encoded in blocks of lines,
+    on the calling thread: max_workers is ignored.
+    """
+    columns = [dataframe.iloc[:, i].tolist() for i in range(dataframe.shape[1])]
+    if len(columns) == 1:
+        lines = columns[0]
+    elif columns:
+        lines = [''.join(values) for values in zip(*columns)]
+    else:
+        lines = [''] * len(dataframe)
 
-def _dataframe_to_txt(writer, dataframe):
-    encoding_writer = codecs.getwriter('utf-8')(writer)
-    for row in dataframe.iterrows():
-        encoding_writer.write("".join(row[1].tolist()))
-        encoding_writer.write('\n')
+    for start in range(0, len(lines), _TXT_BLOCK_LINES):
+        block = lines[start:start + _TXT_BLOCK_LINES]
+        writer.write((u'\n'.join(block) + u'\n').encode('utf-8'))
 
-def _dataframe_from_csv(reader, delimiter, with_header, skipspace):
-    """Returns csv data as a pandas Dataframe object"""
+def _dataframe_from_csv(reader, delimiter, with_header, skipspace,
+                        chunksize=None, columns=None, dtypes=None, engine=None):
+    """
+    Returns csv data as a pandas Dataframe object. If chunksize is specified,
+    returns an iterator of Dataframe objects of up to chunksize rows instead.
+    The columns not in columns are skipped by the parser.
+    If engine is 'parallel', blocks of the data are parsed on several threads,
+    unless there is a single CPU.
+    """
     sep = delimiter
     header = 0
     if not with_header:
         header = None
+    if columns is not None and not callable(columns):
+        columns = list(columns)
+
+    if engine == _PARALLEL_ENGINE and cpu_count() > 1:
+        result = _parallel_read_csv(
+            reader.read(), sep, header, skipspace, columns, dtypes)
+        if columns is None or callable(columns):
+            return result
+        return _project(result, columns)
 
-    return pd.read_csv(
+    result = pd.read_csv(
         reader,
         header=header,
         sep=sep,
         skipinitialspace=skipspace,
-        encoding='utf-8-sig'
+        encoding='utf-8-sig',
+        chunksize=chunksize,
+        usecols=columns,
+        dtype=dtypes,
+    )
+    if columns is None or callable(columns):
+        return result
+    if chunksize is None:
+        return _project(result, columns)
+    # usecols keeps the columns in file order
+    return (_project(frame, columns) for frame in result)
+
+def _parallel_read_csv(data, sep, header, skipspace, columns, dtypes):
+    """
+    Parses csv data split in blocks of whole records, one block per thread,
+    and concatenates the results. Falls back to parsing the data at once when
+    the types inferred for a column differ between blocks, so that the result
+    is the same as the one of the sequential parser.
+
+    A quote inside an unquoted field can mislead _csv_record_end into
+    splitting the data inside a quoted field. The block before the split
+    then fails to parse, ending in the quoted field, and the data is parsed
+    at once instead. A header spanning several lines is not split at all.
+    """
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8):]
+    read = partial(
+        pd.read_csv,
+        sep=sep,
+        skipinitialspace=skipspace,
+        encoding='utf-8',
+        usecols=columns,
+        dtype=dtypes,
+    )
+
+    # the header is parsed the same way as the records, which resolves
+    # quoting and duplicate names; the columns of a file without header
+    # are numbered
+    first = _csv_record_end(data, 0)
+    if header is not None and first != data.find(b'\n') + 1:
+        return read(BytesIO(data), header=header)
+    try:
+        names = list(pd.read_csv(
+            BytesIO(data[:first]),
+            header=header,
+            sep=sep,
+            skipinitialspace=skipspace,
+            encoding='utf-8',
+            nrows=0,
+        ).columns)
+    except pd.errors.ParserError:
+        return read(BytesIO(data), header=header)
+    start = first if header is not None else 0
+
+    bounds = _csv_blocks(data, start, _PARALLEL_BLOCK_SIZE)
+    if len(bounds) < 2:
+        return read(BytesIO(data), header=header)
+
+    def parse(bound):
+        return read(
+            BytesIO(data[bound[0]:bound[1]]), header=None, names=names)
+
+    pool = ThreadPool(min(cpu_count(), len(bounds)))
+    try:
+        frames = pool.map(parse, bounds)
+    except pd.errors.ParserError:
+        return read(BytesIO(data), header=header)
+    finally:
+        pool.close()
+
+    for name in frames[0].columns:
+        kinds = set(frame[name].dtype for frame in frames)
+        if len(kinds) > 1 and not all(kind.kind in 'if' for kind in kinds):
+            return read(BytesIO(data), header=header)
+    return pd.concat(frames, ignore_index=True)
+
+def _csv_blocks(data, start, size):
+    """
+    Returns the (start, end) offsets of the blocks of data from start, of
+    about size bytes each, which end at record boundaries.
+    """
+    bounds = []
+    while start < len(data):
+        end = _csv_record_end(data, min(start + size, len(data)), start)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+def _csv_record_end(data, offset, start=0):
+    """
+    Returns the offset after the first line break at or after offset that is
+    not in a quoted field, for records starting at start. Quotes escaped by
+    doubling them do not change the quoting state.
+    """
+    quotes = data.count(b'"', start, offset)
+    while True:
+        end = data.find(b'\n', offset)
+        if end < 0:
+            return len(data)
+        end += 1
+        quotes += data.count(b'"', offset, end)
+        if quotes % 2 == 0:
+            return end
+        offset = end
+
+def _project(dataframe, columns):
+    """Returns the dataframe with the specified columns, in that order."""
+    if callable(columns):
+        columns = [column for column in dataframe.columns if columns(column)]
+    else:
+        columns = list(columns)
+    if list(dataframe.columns) == columns:
+        return dataframe
+    return dataframe[columns]
+
+def _dataframe_from_txt(reader, chunksize=None, columns=None, dtypes=None,
+                        engine=None):
+    """
+    Returns PlainText data as a pandas Dataframe object, with one row per
+    non-blank line in column 0. If chunksize is specified, returns an
+    iterator of Dataframe objects of up to chunksize rows instead.
+    The lines are always split on the calling thread, engine is ignored.
+    """
+    blocks = _iter_txt_lines(reader)
+    if chunksize is None:
+        return _txt_frame(list(chain.from_iterable(blocks)), 0, columns, dtypes)
+    return _iter_txt_frames(blocks, chunksize, columns, dtypes)
+
+def _iter_txt_frames(blocks, chunksize, columns, dtypes):
+    lines = []
+    start = 0
+    for block in blocks:
+        lines.extend(block)
+        while len(lines) >= chunksize:
+            yield _txt_frame(lines[:chunksize], start, columns, dtypes)
+            del lines[:chunksize]
+            start += chunksize
+    if lines:
+        yield _txt_frame(lines, start, columns, dtypes)
+
+def _txt_frame(lines, start, columns, dtypes):
+    dataframe = pd.DataFrame(
+        {0: lines},
+        index=pd.RangeIndex(start, start + len(lines)),
+        dtype=None if lines else object,
+    )
+    if dtypes is not None:
+        dataframe = dataframe.astype(dtypes)
+    if columns is not None:
+        dataframe = _project(dataframe, columns)
+    return dataframe
+
+def _iter_txt_lines(reader):
+    """
+    Yields the non-blank lines of PlainText data in lists, one list per
+    block read. The blocks are decoded incrementally, so a BOM is stripped
+    once and characters split across blocks are decoded correctly. Lines end
+    with LF, CRLF or CR.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    pending = u''
+    while True:
+        data = reader.read(_TXT_READ_SIZE)
+        text = pending + decoder.decode(data, final=not data)
+        carry = u''
+        if u'\r' in text:
+            if data and text.endswith(u'\r'):
+                # the next block may start with the LF of a CRLF
+                text, carry = text[:-1], u'\r'
+            text = text.replace(u'\r\n', u'\n').replace(u'\r', u'\n')
+        lines = text.split(u'\n')
+        if data:
+            pending = lines.pop() + carry
+        yield list(filter(None, lines))
+        if not data:
+            return
+
+
+def _dataframe_to_arff(writer, dataframe, max_workers=None):
+    """
+    Writes the dataframe as ARFF, with an attribute per column. Numeric
+    columns become NUMERIC attributes, categorical and boolean columns
+    nominal attributes, datetime columns DATE attributes and the other
+    columns STRING attributes. Missing values are written as ?. The data is
+    formatted on the calling thread: max_workers is ignored.
+    """
+    header = [u'@RELATION\t' + _ARFF_RELATION, u'']
+    columns = []
+    for i in range(dataframe.shape[1]):
+        column = dataframe.iloc[:, i]
+        attribute_type, values = _arff_column(column)
+        header.append(u'@ATTRIBUTE\t{0}\t{1}'.format(
+            _arff_quote(u'{0}'.format(dataframe.columns[i])), attribute_type))
+        columns.append(values)
+    header.extend((u'', u'@DATA', u''))
+    writer.write(u'\n'.join(header).encode('utf-8'))
+
+    if len(columns) == 1:
+        lines = columns[0]
+    elif columns:
+        lines = [u','.join(values) for values in zip(*columns)]
+    else:
+        lines = []
+
+    for start in range(0, len(lines), _TXT_BLOCK_LINES):
+        block = lines[start:start + _TXT_BLOCK_LINES]
+        writer.write((u'\n'.join(block) + u'\n').encode('utf-8'))
+
+def _arff_column(column):
+    """Returns the attribute type and the list of values of a column."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        # quote each category once, code -1 being a missing value
+        categories = [_arff_quote(u'{0}'.format(value)) for value in column.cat.categories]
+        attribute_type = u'{' + u','.join(categories) + u'}'
+        return attribute_type, [(categories + [u'?'])[code] for code in column.cat.codes.tolist()]
+
+    missing = column.isnull().tolist()
+    if pd.api.types.is_bool_dtype(column):
+        attribute_type = u'{False,True}'
+        values = [u'{0}'.format(value) for value in column.tolist()]
+    elif pd.api.types.is_integer_dtype(column):
+        attribute_type = u'NUMERIC'
+        values = [u'{0}'.format(value) for value in column.tolist()]
+    elif pd.api.types.is_numeric_dtype(column):
+        attribute_type = u'NUMERIC'
+        values = [repr(value) for value in column.tolist()]
+    elif pd.api.types.is_datetime64_any_dtype(column):
+        attribute_type = u'DATE "{0}"'.format(_ARFF_DATE_FORMAT[0])
+        values = column.dt.strftime(_ARFF_DATE_FORMAT[1]).tolist()
+    else:
+        attribute_type = u'STRING'
+        values = [_arff_quote(u'{0}'.format(value)) for value in column.tolist()]
+    return attribute_type, [
+        u'?' if is_missing else value
+        for value, is_missing in zip(values, missing)
+    ]
+
+def _arff_quote(value):
+    """Quotes a name or value if it contains characters special to ARFF."""
+    if value and not _ARFF_SPECIAL_CHARS.search(value):
+        return value
+    return u"'" + value.replace(u'\\', u'\\\\').replace(u"'", u"\\'") + u"'"
+
+def _dataframe_from_arff(reader, chunksize=None, columns=None, dtypes=None,
+                         engine=None):
+    """
+    Returns ARFF data as a pandas Dataframe object, with a column per
+    attribute. NUMERIC, REAL and INTEGER attributes become float columns,
+    nominal attributes categorical columns, DATE attributes datetime columns
+    and STRING attributes string columns. The header is read first, then the
+    data section is tokenized by read_csv, so chunksize, columns and dtypes
+    work as for the csv formats. Sparse data is not supported. The data
+    section is always parsed on the calling thread, engine is ignored.
+
+    read_csv takes a single quote character, so _ArffDataReader rewrites the
+    double quoted values with single quotes, and drops the comment lines.
+    read_csv does not tell quoted values from unquoted ones either, so only
+    a bare ? is read as missing: _ArffDataReader adds a ? to the other values
+    made of question marks, such as '?', and finish removes it.
+    """
+    attributes = _read_arff_header(reader)
+    names = [name for name, _, _ in attributes]
+    column_dtypes = dict((name, dtype) for name, dtype, _ in attributes)
+    date_formats = dict(
+        (name, date_format) for name, _, date_format in attributes
+        if date_format is not None and (dtypes is None or name not in dtypes))
+    if dtypes is not None:
+        column_dtypes.update(dtypes)
+    if columns is not None and not callable(columns):
+        columns = list(columns)
+
+    data_reader = _ArffDataReader(reader)
+    result = pd.read_csv(
+        BufferedReader(data_reader),
+        header=None,
+        names=names,
+        sep=',',
+        quotechar="'",
+        escapechar='\\',
+        skipinitialspace=True,
+        na_values=['?'],
+        keep_default_na=False,
+        encoding='utf-8',
+        chunksize=chunksize,
+        usecols=columns,
+        dtype=column_dtypes,
     )
 
-def _dataframe_from_txt(reader):
-    """Returns PlainText data as a pandas Dataframe object"""
-    return pd.read_csv(reader, header=None, sep="\n", encoding='utf-8-sig')
+    def finish(dataframe):
+        for name in dataframe.columns:
+            column = dataframe[name]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                dataframe[name] = column.cat.rename_categories(
+                    _unescape_arff_question_marks(column.cat.categories))
+            elif data_reader.question_marks and pd.api.types.is_string_dtype(column):
+                dataframe[name] = _unescape_arff_question_marks(column)
+        for name, date_format in date_formats.items():
+            if name in dataframe:
+                dataframe[name] = pd.to_datetime(dataframe[name], format=date_format)
+        return dataframe if columns is None else _project(dataframe, columns)
+
+    if chunksize is None:
+        return finish(result)
+    return (finish(dataframe) for dataframe in result)
+
+class _ArffDataReader(RawIOBase):
+    """
+    Read-only stream over the data section of ARFF data, without its comment
+    lines and with its double quoted values quoted with single quotes. A ?
+    is added to the values made of question marks, other than a bare ?, and
+    question_marks is set once the data may have such a value.
+    """
+
+    def __init__(self, reader):
+        self._reader = reader
+        self._pending = memoryview(b'')
+        self.question_marks = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending:
+            # read whole lines, only looking at each one when the block has
+            # a double quoted value or a comment
+            block = self._reader.read(_TXT_READ_SIZE)
+            if not block:
+                return 0
+            if not block.endswith(b'\n'):
+                block += self._reader.readline()
+            question_marks = b'?' in block and _has_arff_question_marks(block)
+            self.question_marks = self.question_marks or question_marks
+            if question_marks or not _is_plain_arff_block(block):
+                block = b''.join(
+                    _requote_arff_line(line) for line in block.splitlines(True)
+                    if not line.lstrip().startswith(b'%'))
+            self._pending = memoryview(block)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+def _is_plain_arff_block(block):
+    """
+    Returns True if whole lines of ARFF data have no comment line and no
+    double quoted value, looking for the usual cases with substring searches
+    before using a regular expression.
+    """
+    block = b'\n' + block
+    if b'%' in block and _ARFF_COMMENT_LINE.search(block):
+        return False
+    if b'"' not in block:
+        return True
+    if b',"' in block or b'\n"' in block:
+        return False
+    if b', ' in block or b',\t' in block or b'\n ' in block or b'\n\t' in block:
+        return not _ARFF_SPACED_DOUBLE_QUOTE.search(block)
+    return True
+
+def _has_arff_question_marks(block):
+    """
+    Returns True if data may have a value made of question marks, other than
+    a bare ?, which is a missing value.
+    """
+    return b'??' in block or b"?'" in block or b'?"' in block
+
+def _requote_arff_line(line):
+    if b'"' not in line and not _has_arff_question_marks(line):
+        return line
+    return _ARFF_QUOTED_VALUE.sub(_requote_arff_value, line)
+
+def _requote_arff_value(match):
+    """
+    Quotes a value matched by _ARFF_QUOTED_VALUE with single quotes, adding
+    a ? if it is made of question marks.
+    """
+    space, single, double, bare = match.groups()
+    if bare is not None:
+        return space + b'?' + bare
+    if single is not None:
+        if not _ARFF_QUESTION_MARKS.match(single):
+            return match.group(0)
+        value = single
+    else:
+        value = _ARFF_ESCAPE.sub(_escape_arff_char, double)
+    if _ARFF_QUESTION_MARKS.match(value):
+        value = b'?' + value
+    return space + b"'" + value + b"'"
+
+def _escape_arff_char(match):
+    char = match.group(1)
+    if char is None:
+        return b"\\'"
+    if char == b'"':
+        return b'"'
+    if char == b"'":
+        return b"\\'"
+    return match.group(0)
+
+def _unescape_arff_question_marks(values):
+    """
+    Removes the ? added by _ArffDataReader to the values made of question
+    marks, in an Index or a Series of strings.
+    """
+    escaped = values.str.fullmatch(u'\\?\\?+')
+    if isinstance(values, pd.Series):
+        escaped = escaped.fillna(False).astype(bool)
+    if not escaped.any():
+        return values
+    return values.where(~escaped, values.str[1:])
+
+def _read_arff_header(reader):
+    """
+    Reads the header of ARFF data up to the @DATA line, and returns a list
+    of (name, dtype, date format) for its attributes.
+    """
+    attributes = []
+    encoding = 'utf-8-sig'
+    while True:
+        line = reader.readline()
+        if not line:
+            raise ValueError('The ARFF data has no @DATA section.')
+        line = line.decode(encoding).strip()
+        encoding = 'utf-8'
+        if not line or line.startswith(u'%'):
+            continue
+
+        parts = line.split(None, 1)
+        keyword = parts[0].lower()
+        if keyword == u'@data':
+            return attributes
+        if keyword == u'@attribute' and len(parts) > 1:
+            name, attribute_type = _split_arff_name(parts[1])
+            attributes.append((name,) + _arff_dtype(attribute_type))
+
+def _split_arff_name(text):
+    """Returns the name at the start of text, unquoted, and the rest of text."""
+    quote = text[0]
+    if quote not in u'\'"':
+        parts = text.split(None, 1)
+        return parts[0], parts[1] if len(parts) > 1 else u''
+
+    name = []
+    i = 1
+    while i < len(text) and text[i] != quote:
+        if text[i] == u'\\' and i + 1 < len(text):
+            i += 1
+        name.append(text[i])
+        i += 1
+    return u''.join(name), text[i + 1:].strip()
+
+def _split_arff_values(text):
+    """Splits comma separated values, which may be quoted, and unquotes them."""
+    values = []
+    value = []
+    quote = None
+    i = 0
+    while i < len(text):
+        c = text[i]
+        if quote is not None:
+            if c == u'\\' and i + 1 < len(text):
+                i += 1
+                value.append(text[i])
+            elif c == quote:
+                quote = None
+            else:
+                value.append(c)
+        elif c in u'\'"':
+            quote = c
+        elif c == u',':
+            values.append(u''.join(value))
+            value = []
+        elif not c.isspace():
+            value.append(c)
+        i += 1
+    values.append(u''.join(value))
+    return values
+
+def _arff_dtype(attribute_type):
+    """Returns the dtype and date format, or None, for an attribute type."""
+    if attribute_type.startswith(u'{'):
+        values = _split_arff_values(attribute_type[1:attribute_type.rindex(u'}')])
+        # categories made of question marks are read with an added ?, as the
+        # data values
+        return pd.CategoricalDtype([
+            u'?' + value if not value.strip(u'?') else value
+            for value in values if value
+        ]), None
+
+    parts = attribute_type.split(None, 1)
+    kind = parts[0].lower() if parts else u''
+    if kind in (u'numeric', u'real', u'integer'):
+        return 'float64', None
+    if kind == u'string':
+        return str, None
+    if kind == u'date':
+        date_format = _ARFF_DATE_FORMAT[0]
+        if len(parts) > 1:
+            date_format = _split_arff_name(parts[1])[0]
+        return str, _java_date_format(date_format)
+    raise ValueError('ARFF attribute type "{0}" is not supported.'.format(attribute_type))
+
+def _java_date_format(pattern):
+    """Converts a Java SimpleDateFormat pattern, used by ARFF, for strptime."""
+    result = []
+    for literal, field in re.findall(r"'([^']*)'|(y+|M+|d+|H+|m+|s+|S+|Z+|.)", pattern):
+        if field in _JAVA_DATE_FIELDS:
+            result.append(_JAVA_DATE_FIELDS[field])
+        else:
+            # quoted text is literal, and '' is a single quote
+            result.append((field or literal or u"'").replace(u'%', u'%%'))
+    return u''.join(result)
 
 
 _SERIALIZERS = {
+    DataTypeIds.ARFF: (
+        _dataframe_to_arff,
+        _dataframe_from_arff,
+    ),
     DataTypeIds.PlainText: (
         _dataframe_to_txt,
         _dataframe_from_txt,
@@ -104,7 +736,7 @@ _SERIALIZERS = {
 }
 
 
-def serialize_dataframe(writer, data_type_id, dataframe):
+def serialize_dataframe(writer, data_type_id, dataframe, max_workers=None):
     """
     Serialize a dataframe.
 
@@ -117,6 +749,12 @@ def serialize_dataframe(writer, data_type_id, dataframe):
         See the azureml.DataTypeIds class for constants.
     dataframe: pandas.DataFrame
         Dataframe to serialize.
+    max_workers : int, optional
+        Number of processes formatting blocks of rows of large dataframes,
+        for the csv and tsv formats. The output is the same as the one of
+        the sequential serializer. Worker processes import the calling
+        module on platforms which spawn them, which must then be guarded
+        by if __name__ == '__main__'.
     """
     _not_none('writer', writer)
     _not_none_or_empty('data_type_id', data_type_id)
@@ -125,9 +763,13 @@ def serialize_dataframe(writer, data_type_id, dataframe):
     serializer = _SERIALIZERS.get(data_type_id)
     if serializer is None:
         raise UnsupportedDatasetTypeError(data_type_id)
-    serializer[0](writer=writer, dataframe=dataframe)
+    options = {}
+    if max_workers is not None:
+        options['max_workers'] = max_workers
+    serializer[0](writer=writer, dataframe=dataframe, **options)
 
-def deserialize_dataframe(reader, data_type_id):
+def deserialize_dataframe(reader, data_type_id, chunksize=None, columns=None,
+                          dtypes=None, engine=None):
     """
     Deserialize a dataframe.
 
@@ -138,19 +780,45 @@ def deserialize_dataframe(reader, data_type_id):
     data_type_id : dict
         Serialization format of the raw data.
         See the azureml.DataTypeIds class for constants.
+    chunksize : int, optional
+        Number of rows per dataframe. If specified, the raw data is parsed
+        while it is read, one chunk at a time.
+    columns : list, optional
+        Columns to return, in that order: names, or positions for the
+        formats without a header. The parser skips the other columns.
+    dtypes : dict, optional
+        Data types of columns, such as {'id': 'int32', 'city': 'category'}.
+        The columns not specified have their type inferred.
+    engine : str, optional
+        Parser to use. 'parallel' reads all the raw data, then parses blocks
+        of records on several threads, for the csv and tsv formats. The
+        result is the same as the one of the default parser. With a single
+        CPU, the default parser is used. Cannot be combined with chunksize.
 
     Returns
     -------
     pandas.DataFrame
         Dataframe object.
+        If chunksize is specified, an iterator of Dataframe objects instead.
     """
     _not_none('reader', reader)
     _not_none_or_empty('data_type_id', data_type_id)
 
+    if engine not in (None, _PARALLEL_ENGINE):
+        raise ValueError('Unknown engine "{0}"'.format(engine))
+    if engine is not None and chunksize is not None:
+        raise ValueError('engine and chunksize cannot be combined')
+
     serializer = _SERIALIZERS.get(data_type_id)
     if serializer is None:
         raise UnsupportedDatasetTypeError(data_type_id)
-    return serializer[1](reader=reader)
+    options = dict(
+        (name, value) for name, value in (
+            ('chunksize', chunksize), ('columns', columns), ('dtypes', dtypes),
+            ('engine', engine))
+        if value is not None
+    )
+    return serializer[1](reader=reader, **options)
 
 def is_supported(data_type_id):
     """Return if a serializer is available for the specified format."""
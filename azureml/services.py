@@ -69,6 +69,16 @@ Files can also be attached to published functions using the @attach decorator:
 def attached():
     return ''.join(file('foo.txt').readlines())
 
+The results of a service whose function always returns the same result for the same
+arguments can be cached on the client with the @cache decorator:
+
+@services.service(url, api_key)
+@services.cache(max_entries=10000, ttl=3600)
+@services.types(a = int)
+@services.returns(str)
+def lookup(a):
+    pass
+
 """
 from functools import update_wrapper
 import codecs
@@ -81,7 +91,12 @@ import json
 import base64
 import zipfile
 import dis
-from collections import deque, OrderedDict
+import hashlib
+import os
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+from collections import deque, namedtuple, OrderedDict
 from types import CodeType, FunctionType, ModuleType
 import types as typesmod
 try:
@@ -94,6 +109,8 @@ except:
     from cStringIO import StringIO as BytesIO
 try:
     import azureml
+    from azureml.errors import _TRANSIENT_STATUS_CODES
+    from azureml.http import RetryPolicy, _get_retry_after, _replace_file
 except:
     # We are published, we won't call publish_worker again.
     pass
@@ -480,30 +497,44 @@ def _get_args(func):
     all_args = args.args
     if args.varargs is not None:
         all_args.append(args.varargs)
-    if args.keywords is not None:
-        all_args.append(args.keywords)
+    # the name is varkw on Python 3
+    keywords = getattr(args, 'keywords', None) or getattr(args, 'varkw', None)
+    if keywords is not None:
+        all_args.append(keywords)
     return all_args
 
-def _encode_arg(arg, type):
+def _encode_string(arg):
+    return arg
+
+def _get_arg_encoder(type):
     if type == OBJECT_NAME:
-        return _encode(arg)
+        return _encode
     elif type['type'].lower() == 'string':
-        return arg
+        return _encode_string
 
-    return json.dumps(arg)
+    return json.dumps
 
-def _decode_one_response(response, real_type):
-    if real_type == OBJECT_NAME:
-        return _decode(response[0])
-    elif real_type['type'].lower() == 'string':
-        return response[0]
-    
+def _encode_arg(arg, type):
+    return _get_arg_encoder(type)(arg)
+
+def _decode_string(value):
+    return value
+
+def _decode_json(value):
     # TODO: These shouldn't be necessary, AzureML is returning things to us oddly...
-    if response[0] == 'True':
+    if value == 'True':
         return True
-    elif response[0] == 'False':
+    elif value == 'False':
         return False
-    return json.loads(response[0])
+    return json.loads(value)
+
+def _get_value_decoder(real_type):
+    if real_type == OBJECT_NAME:
+        return _decode
+    elif real_type['type'].lower() == 'string':
+        return _decode_string
+
+    return _decode_json
 
 def _get_dict_type(column, index, type, types):
     if type is not None and column in type:
@@ -511,16 +542,293 @@ def _get_dict_type(column, index, type, types):
 
     return {'type': types[index]}
 
-def _decode_response(columns, types, response, type):
+def _decode_columns(columns, types, response, decoders):
+    # decodes a row into a dict, using the types sent by the service for the columns without a decoder
+    return {c:(decoders.get(c) or _get_value_decoder({'type': types[i]}))(r) for (i, c), r in zip(enumerate(columns), response)}
+
+def _get_response_decoder(type):
+    """returns a function decoding the (column names, column types, values) of a result row for the
+return annotation type.  The decoders which only depend on the annotation are resolved once, here."""
     if isinstance(type, tuple):
         # multi-value decode...
-        return tuple(_decode_one_response((r, ), _annotation_to_type(t)) for r, t in zip(response, type))
+        decoders = tuple(_get_value_decoder(_annotation_to_type(t)) for t in type)
+        def decode(columns, types, response):
+            return tuple(decoder(r) for decoder, r in zip(decoders, response))
     elif isinstance(type, dict):
-        return {c:_decode_one_response((r, ), _get_dict_type(c, i, type, types)) for (i, c), r in zip(enumerate(columns), response)}
+        decoders = {c:_get_value_decoder(_annotation_to_type(t)) for c, t in type.items()}
+        def decode(columns, types, response):
+            return _decode_columns(columns, types, response, decoders)
+    else:
+        decoder = _get_value_decoder(_annotation_to_type(type))
+        def decode(columns, types, response):
+            if columns is not None and len(columns) > 1:
+                return _decode_columns(columns, types, response, {})
+            return decoder(response[0])
+    return decode
+
+def _get_column_type(columns, types, index, type):
+    # the type used by the _get_response_decoder decoder for the column at index
+    if isinstance(type, tuple):
+        return _annotation_to_type(type[index])
+    elif isinstance(type, dict):
+        return _get_dict_type(columns[index], index, type, types)
     elif columns is not None and len(columns) > 1:
-        return {c:_decode_one_response((r, ), {'type': types[i]}) for (i, c), r in zip(enumerate(columns), response)}
+        return {'type': types[index]}
+
+    return _annotation_to_type(type)
+
+_INTEGER_TYPES = ('integer', 'int16', 'int32', 'int64')
+_FLOAT_TYPES = ('number', 'numeric', 'double', 'single', 'float')
+
+def _decode_column(values, real_type):
+    """decodes a column of response values at once.  String columns are kept as they are, numeric
+and boolean columns are converted by numpy in one pass, and the columns numpy cannot convert are
+decoded one value at a time like _get_value_decoder does."""
+    if real_type != OBJECT_NAME:
+        kind = real_type['type'].lower()
+        if kind == 'string':
+            return values
+        try:
+            column = numpy.array(values)
+            if kind in _INTEGER_TYPES:
+                try:
+                    return column.astype(numpy.int64)
+                except ValueError:
+                    return column.astype(numpy.float64)
+            elif kind in _FLOAT_TYPES:
+                return column.astype(numpy.float64)
+            elif kind == 'boolean':
+                is_true = column == 'True'
+                if (is_true | (column == 'False')).all():
+                    return is_true
+        except (ValueError, TypeError, OverflowError):
+            pass
+
+    decode = _get_value_decoder(real_type)
+    return [decode(value) for value in values]
+
+def _decode_frame(results, type):
+    """decodes (column names, column types, values) result rows into a DataFrame, column by column"""
+    if not results:
+        return pandas.DataFrame()
+
+    columns, types = results[0][0], results[0][1]
+    rows = [values for _, _, values in results]
+    count = len(rows[0])
+    if isinstance(type, tuple):
+        count = min(count, len(type))
+    names = list(columns[:count]) if columns is not None else list(range(count))
+    return pandas.DataFrame(
+        OrderedDict(
+            (name, _decode_column([row[index] for row in rows], _get_column_type(columns, types, index, type)))
+            for index, name in enumerate(names)
+        ),
+        columns=names
+    )
+
+class _TransientServiceError(ValueError):
+    """The service failed with a status code for which the call can be retried.  RetryPolicy.is_retriable
+tells so from its status_code."""
+    def __init__(self, message, status_code, retry_after):
+        super(_TransientServiceError, self).__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+_clock = getattr(time, 'monotonic', time.time)
+
+class _BatchedCall(object):
+    """a call waiting for the result of the batch it was sent in"""
+    def __init__(self, args):
+        self.args = args
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+class _MicroBatcher(object):
+    """Collects the arguments of concurrent calls into batches sent with send, which maps a list of
+call arguments to the list of their results.
+
+The first call of a batch waits up to max_delay seconds for other calls, then sends the batch.  A
+call which brings the batch to max_rows sends it right away.  Every call then waits for its own
+result, or the error of its batch."""
+    def __init__(self, send, max_rows, max_delay):
+        self.send = send
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self._cond = threading.Condition()
+        self._pending = []
+        self._batches = 0
+
+    def call(self, args):
+        call = _BatchedCall(args)
+        batch = None
+        with self._cond:
+            self._pending.append(call)
+            if len(self._pending) >= self.max_rows:
+                batch = self._take()
+            elif len(self._pending) == 1:
+                batches = self._batches
+                deadline = _clock() + self.max_delay
+                remaining = self.max_delay
+                while self._batches == batches and remaining > 0:
+                    self._cond.wait(remaining)
+                    remaining = deadline - _clock()
+                if self._batches == batches:
+                    batch = self._take()
+        if batch is not None:
+            self._send(batch)
+        return call.wait()
+
+    def _take(self):
+        batch, self._pending = self._pending, []
+        self._batches += 1
+        self._cond.notify_all()
+        return batch
+
+    def _send(self, batch):
+        try:
+            results = self.send([call.args for call in batch])
+            if len(results) != len(batch):
+                raise ValueError('expected {} results, got {}'.format(len(batch), len(results)))
+            for call, result in zip(batch, results):
+                call.result = result
+        except Exception as e:
+            for call in batch:
+                call.error = e
+        finally:
+            for call in batch:
+                call.done.set()
+
+class _ResultCache(object):
+    """LRU cache of the results of a published service, keyed on the encoded arguments of a call.
+The values are the raw result rows, which are decoded again on every hit so that callers never
+share a result object.
+
+Up to max_entries results are kept in memory, each for ttl seconds, or until evicted if ttl is
+None.  If path is given every result is also stored in a file of that directory, so that it
+survives the process; the files are kept until clear() is called, or until they are found expired.
+The names of the files start with a hash of the service url, so that several services can share a
+directory.  hits and misses count the lookups."""
+    def __init__(self, max_entries=1000, ttl=None, path=None, url=''):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = path
+        self._prefix = hashlib.sha1(url.encode('utf-8')).hexdigest() + '-'
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if path is not None and not os.path.isdir(path):
+            os.makedirs(path)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None and self.path is not None:
+                entry = self._load(key)
+            if entry is not None and (entry[0] is None or entry[0] > time.time()):
+                self._add(key, entry)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        expires = None if self.ttl is None else time.time() + self.ttl
+        with self._lock:
+            self._entries.pop(key, None)
+            self._add(key, (expires, value))
+            if self.path is not None:
+                self._store(key, expires, value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self.path is not None:
+                for name in os.listdir(self.path):
+                    if name.startswith(self._prefix) and name.endswith('.json'):
+                        os.remove(os.path.join(self.path, name))
+
+    def _add(self, key, entry):
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _get_file_name(self, key):
+        return os.path.join(
+            self.path, self._prefix + hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    def _load(self, key):
+        file_name = self._get_file_name(key)
+        try:
+            with open(file_name, 'r') as cache_file:
+                stored = json.load(cache_file)
+        except (EnvironmentError, ValueError):
+            return None
+        if stored.get('key') != key:
+            return None
+        expires = stored['expires']
+        if expires is not None and expires <= time.time():
+            try:
+                os.remove(file_name)
+            except EnvironmentError:
+                pass
+            return None
+        return expires, stored['value']
+
+    def _store(self, key, expires, value):
+        file_name = self._get_file_name(key)
+        with open(file_name + '.tmp', 'w') as cache_file:
+            json.dump({'key': key, 'expires': expires, 'value': value}, cache_file)
+        _replace_file(file_name + '.tmp', file_name)
+
+class _CallPlan(namedtuple('_CallPlan', 'arg_names encoders positional input_name output_name return_type decoder')):
+    """The metadata of a published function used by every call, computed once: the names of its
+arguments in input column order, the encoder of each argument, whether positional arguments map
+directly to the columns, the names of the input and output of the service, the return
+annotation and the decoder of the results."""
+    __slots__ = ()
+
+    @classmethod
+    def create(cls, func):
+        arg_names = tuple(_get_args(func))
+        return_type = _get_annotation('return', func)
+        code_args = inspect.getargs(func.__code__)
+        positional = (
+            _get_dataframe_schema(func) is None and
+            code_args.varargs is None and
+            tuple(code_args.args) == arg_names
+        )
+        return cls(
+            arg_names,
+            tuple(_get_arg_encoder(_get_arg_type(name, func)) for name in arg_names),
+            positional,
+            getattr(func, '__input_name__', 'input1'),
+            getattr(func, '__output_name__', 'output1'),
+            return_type,
+            _get_response_decoder(return_type),
+        )
 
-    return _decode_one_response(response, _annotation_to_type(type))
+    def encode(self, func, args, kwargs):
+        if self.positional and not kwargs and len(args) == len(self.arg_names):
+            values = args
+        else:
+            call_args = inspect.getcallargs(func, *args, **kwargs)
+            values = [call_args[name] for name in self.arg_names]
+        return [encode(value) for encode, value in zip(self.encoders, values)]
+
+    def decode(self, result):
+        columns, types, values = result
+        return self.decoder(columns, types, values)
+
+    def decode_frame(self, results):
+        return _decode_frame(results, self.return_type)
 
 class published(object):
     """The result of publishing a service or marking a method as being published.
@@ -530,28 +838,45 @@ api key, and help url, or the url, api_key, and help_url can be accessed directl
 as attributes.
 """
 
+    # connections kept open to the service, which should be at least the max_concurrency of map
+    POOL_MAXSIZE = 10
+    # RetryPolicy for the batches of map, the default policy if None
+    retry_policy = None
+
     def __init__(self, url, api_key, help_url, func, service_id):
         self.url = url
         self.api_key = api_key
         self.help_url = help_url
         self.func = func
         self.service_id = service_id
+        self._session = None
+        self._batcher = None
+        self._plan = None
+        cache = getattr(func, '__cache__', None)
+        self.cache = None if cache is None else _ResultCache(url=url, **cache)
 
     def __repr__(self):
         return '<service {} at {}>'.format(self.func.__name__, self.url)
 
+    def _get_plan(self):
+        plan = self._plan
+        if plan is None:
+            plan = self._plan = _CallPlan.create(self.func)
+        return plan
+
     def _invoke(self, call_args):
+        plan = self._get_plan()
         body = {
             "Inputs": {
-                getattr(self.func, '__input_name__', 'input1'): {
-                    "ColumnNames": _get_args(self.func),
+                plan.input_name: {
+                    "ColumnNames": list(plan.arg_names),
                     "Values": call_args,
                 }
             },
             "GlobalParameters": {}
         }
 
-        resp = requests.post(
+        resp = self._get_session().post(
             self.url, 
             json=body, 
             headers={
@@ -559,47 +884,136 @@ as attributes.
             }
         )
         
-        r = resp.json()
-        if resp.status_code >= 300:
-            try:
-                code = r['error']['code']
-            except LookupError:
-                code = None
-            if code in ('ModuleExecutionError', 'Unauthorized'):
-                raise RuntimeError(r['error']['details'][0]['message'])
-            raise ValueError(str(r))
-        return r
+        if resp.status_code < 300:
+            return resp.json()
+
+        try:
+            r = resp.json()
+            code = r['error']['code']
+        except (ValueError, LookupError, TypeError):
+            # a gateway error may not even be json
+            r = resp.text
+            code = None
+        if code in ('ModuleExecutionError', 'Unauthorized'):
+            raise RuntimeError(r['error']['details'][0]['message'])
+        if resp.status_code in _TRANSIENT_STATUS_CODES:
+            raise _TransientServiceError(resp.text, resp.status_code, _get_retry_after(resp))
+        raise ValueError(str(r))
+
+    def _get_session(self):
+        # a session per service, so that the calls reuse its connections
+        if self._session is None:
+            self._session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.POOL_MAXSIZE)
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+        return self._session
 
     def _map_args(self, *args, **kwargs):
-        args = inspect.getcallargs(self.func, *args, **kwargs)
-        return [ _encode_arg(args[name], _get_arg_type(name, self.func)) for name in _get_args(self.func) ]
+        return self._get_plan().encode(self.func, args, kwargs)
+
+    def enable_batching(self, max_rows=100, max_delay=0.01):
+        """batches the calls made concurrently from several threads.  A call waits up to max_delay
+seconds for other calls, then the calls are sent together in a single request of up to max_rows
+rows, like a batch of map.  Each call returns its own result, or raises the error of its batch."""
+        self._batcher = _MicroBatcher(self._send_batch, max_rows, max_delay)
+
+    def disable_batching(self):
+        """sends each call in its own request again"""
+        self._batcher = None
 
     def __call__(self, *args, **kwargs):
-        # Call remote function
-        r = self._invoke([ self._map_args(*args, **kwargs) ])
-        output_name = getattr(self.func, '__output_name__', 'output1')
-        return _decode_response(
-            r["Results"][output_name]["value"].get("ColumnNames"),
-            r["Results"][output_name]["value"].get("ColumnTypes"),
-            r["Results"][output_name]["value"]["Values"][0], 
-            _get_annotation('return', self.func)
-        )
+        call_args = self._map_args(*args, **kwargs)
+        cache = self.cache
+        if cache is not None:
+            key = json.dumps(call_args)
+            result = cache.get(key)
+            if result is not None:
+                return self._decode(result)
+
+        batcher = self._batcher
+        if batcher is not None:
+            result = batcher.call(call_args)
+        else:
+            # Call remote function
+            r = self._invoke([ call_args ])
+            output_name = self._get_plan().output_name
+            result = (
+                r["Results"][output_name]["value"].get("ColumnNames"),
+                r["Results"][output_name]["value"].get("ColumnTypes"),
+                r["Results"][output_name]["value"]["Values"][0]
+            )
 
-    def map(self, *args):
+        if cache is not None:
+            cache.put(key, result)
+        return self._decode(result)
+
+    def map(self, *args, **kwargs):
         """maps the function onto multiple inputs.  The input should be multiple sequences.  The
 sequences will be zipped together forming the positional arguments for the call.  This is
-equivalent to map(func, ...) but is executed with a single network call."""
+equivalent to map(func, ...) but is executed with a single network call.
+
+When batch_size is given the inputs are sent in batches of up to batch_size rows, with up to
+max_concurrency batches in flight.  The results are returned in input order.  A batch which
+fails with a transient error is retried on its own, as retry_policy allows.  When the service has
+a cache only the inputs missing from it are sent.
+
+With as_frame=True the results are returned as a pandas DataFrame with a column per output column,
+decoded a column at a time: numeric and boolean columns become numpy arrays."""
+        batch_size = kwargs.pop('batch_size', None)
+        max_concurrency = kwargs.pop('max_concurrency', 1)
+        as_frame = kwargs.pop('as_frame', False)
+        if kwargs:
+            raise TypeError('map() got an unexpected keyword argument ' + repr(next(iter(kwargs))))
+        if batch_size is not None and batch_size < 1:
+            raise ValueError('batch_size should be at least 1')
+        if as_frame and pandas is None:
+            raise ImportError('as_frame requires pandas')
+
         call_args = [self._map_args(*cur_args)  for cur_args in zip(*args)]
-        r = self._invoke(call_args)
+        cache = self.cache
+        if cache is not None:
+            keys = [json.dumps(cur_args) for cur_args in call_args]
+            results = [cache.get(key) for key in keys]
+        else:
+            results = [None] * len(call_args)
+
+        # only the calls missing from the cache are sent
+        missing = [i for i, result in enumerate(results) if result is None]
+        rows = [call_args[i] for i in missing]
+        if batch_size is None:
+            batches = [rows] if rows or cache is None else []
+        else:
+            batches = [rows[start:start + batch_size] for start in range(0, len(rows), batch_size)]
+
+        if max_concurrency > 1 and len(batches) > 1:
+            pool = ThreadPool(min(max_concurrency, len(batches)))
+            try:
+                sent = pool.map(self._send_batch, batches)
+            finally:
+                pool.close()
+        else:
+            sent = [self._send_batch(batch) for batch in batches]
 
-        ret_type = _get_annotation('return', self.func)
-        output_name = getattr(self.func, '__output_name__', 'output1')
-        return [_decode_response(
-                    r['Results'][output_name]['value'].get("ColumnNames"), 
-                    r['Results'][output_name]['value'].get("ColumnTypes"), 
-                    x, 
-                    ret_type) 
-                for x in r['Results']['output1']['value']['Values']]
+        for i, result in zip(missing, (result for batch in sent for result in batch)):
+            results[i] = result
+            if cache is not None:
+                cache.put(keys[i], result)
+        if as_frame:
+            return self._get_plan().decode_frame(results)
+        return [self._decode(result) for result in results]
+
+    def _send_batch(self, call_args):
+        # the results of a batch as (column names, column types, values) rows
+        r = (self.retry_policy or RetryPolicy()).execute(self._invoke, call_args)
+
+        value = r['Results'][self._get_plan().output_name]['value']
+        columns = value.get("ColumnNames")
+        types = value.get("ColumnTypes")
+        return [(columns, types, x) for x in value['Values']]
+
+    def _decode(self, result):
+        return self._get_plan().decode(result)
 
     def delete(self):
         """unpublishes the service"""
@@ -744,6 +1158,7 @@ services.returns = returns
 services.attach = attach
 services.dataframe_service = attach
 services.service_id = attach
+services.cache = attach
 
 '''
         source += source_text
@@ -1000,6 +1415,27 @@ If name is a tuple it specifies the on-disk filename and the destination filenam
         return func
     return do_attach
 
+def cache(max_entries=1000, ttl=None, path=None):
+    """Caches the results of the published service, for functions which always return the same
+result for the same arguments.  Calls and map inputs found in the cache are not sent to the
+service.
+
+@publish(...)
+@cache(max_entries=10000, ttl=3600)
+@types(a=int, b=int)
+def lookup(a, b):
+    pass
+
+Up to max_entries results are kept in memory, for ttl seconds each or until evicted if ttl is
+None.  If path is given the results are also stored in files in that directory, so that they can be
+reused by later processes; several services can share the directory.  The cache of the published
+service, with its hits and misses counters, is available as its cache attribute.
+"""
+    def l(func):
+        func.__cache__ = {'max_entries': max_entries, 'ttl': ttl, 'path': path}
+        return func
+    return l
+
 def service_id(id):
     """Specifies the service ID to enable re-publishing to the same end point.
 Can be applied to the function which is being published:
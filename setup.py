@@ -59,10 +59,14 @@ setup(
         'Programming Language :: Python :: 3.4',
         'License :: OSI Approved :: MIT License',
     ],
-    packages=['azureml'],
+    packages=['azureml', 'azureml.aio'],
     install_requires=[
         'python-dateutil',
         'requests',
         'pandas',
-    ]
+    ],
+    extras_require={
+        # azureml.aio, requires Python 3.5 or later
+        'aio': ['aiohttp'],
+    }
 )
@@ -0,0 +1,110 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation
+# All rights reserved.
+#
+# MIT License:
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#--------------------------------------------------------------------------
+
+import asyncio
+import unittest
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from tests import load_test_settings
+
+
+EXAMPLE_DATASET_NAME = 'Airport Codes Dataset'
+
+settings = load_test_settings()
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class AsyncWorkspaceTests(unittest.TestCase):
+    def setUp(self):
+        from azureml import aio
+        self.loop = asyncio.new_event_loop()
+        self.workspace = aio.Workspace(
+            settings.workspace.id,
+            settings.workspace.token,
+            settings.workspace.endpoint
+        )
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.workspace.close())
+        self.loop.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_list_example_datasets(self):
+        # Arrange
+
+        # Act
+        result = self.run_async(self.workspace.example_datasets.list())
+
+        # Assert
+        self.assertGreater(len(result), 0)
+        self.assertTrue(all(dataset.is_example for dataset in result))
+
+    def test_get_by_id(self):
+        # Arrange
+        expected = self.run_async(self.workspace.datasets.get(EXAMPLE_DATASET_NAME))
+
+        # Act
+        result = self.run_async(self.workspace.datasets.get_by_id(expected.dataset_id))
+
+        # Assert
+        self.assertEqual(result.name, EXAMPLE_DATASET_NAME)
+
+    def test_to_dataframe_concurrent(self):
+        # Arrange
+        dataset = self.run_async(self.workspace.datasets.get(EXAMPLE_DATASET_NAME))
+
+        # Act
+        frames = self.run_async(asyncio.gather(
+            dataset.to_dataframe(), dataset.to_dataframe()))
+
+        # Assert
+        self.assertEqual(frames[0].shape, frames[1].shape)
+        self.assertEqual(frames[0].columns[0], 'airport_id')
+
+    def test_read_intermediate_dataset(self):
+        # Arrange
+        experiment = self.run_async(self.workspace.experiments.get(
+            settings.intermediateDataset.experiment_id))
+        dataset = experiment.get_intermediate_dataset(
+            settings.intermediateDataset.node_id,
+            settings.intermediateDataset.port_name,
+            settings.intermediateDataset.data_type_id,
+        )
+
+        # Act
+        result = self.run_async(dataset.read_as_binary())
+
+        # Assert
+        self.assertGreater(len(result), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
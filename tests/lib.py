@@ -87,6 +87,14 @@ def typed(a, b):
     return a + b
 
 
+@services.publish(TEST_WS, TEST_KEY, endpoint=ENDPOINT)
+@services.cache(max_entries=10)
+@services.types(a = int, b = int)
+@services.returns(int)
+def cached(a, b):
+    return a + b
+
+
 @services.publish(TEST_WS, TEST_KEY, endpoint=ENDPOINT)
 @services.types(a = bool, b = bool)
 @services.returns(bool)
@@ -26,6 +26,7 @@
 import unittest
 import pandas as pd
 from datetime import datetime
+from multiprocessing import cpu_count
 from pandas.util.testing import assert_frame_equal
 
 from azure.storage import BlobService
@@ -76,7 +77,8 @@ class PerformanceTests(unittest.TestCase):
         # Act
         start_time = datetime.now()
         writer = BytesIO()
-        serialize_dataframe(writer, DataTypeIds.GenericCSV, original_dataframe)
+        serialize_dataframe(writer, DataTypeIds.GenericCSV, original_dataframe,
+                            max_workers=cpu_count())
         elapsed_time = datetime.now() - start_time
         result_data = writer.getvalue()
 
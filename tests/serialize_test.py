@@ -26,7 +26,8 @@
 import unittest
 import azureml
 import sys
-from azureml.services import _serialize_func, _deserialize_func, _encode, _decode
+from azureml import services
+from azureml.services import _serialize_func, _deserialize_func, _encode, _decode, _decode_frame
 
 def mutually_ref_f():
     mutually_ref_g
@@ -116,6 +117,147 @@ class Test_serialize_test(unittest.TestCase):
         except:
             return
 
+    def test_call_plan(self):
+        @services.types(a = int, b = str)
+        @services.returns(int)
+        def typed(a, b, c = 3):
+            pass
+
+        service = services.published('url', 'key', None, typed, None)
+
+        expected = ['1', 'x', _encode(3)]
+        self.assertEqual(service._map_args(1, 'x', 3), expected)
+        self.assertEqual(service._map_args(1, c = 3, b = 'x'), expected)
+        self.assertEqual(service._get_plan().arg_names, ('a', 'b', 'c'))
+        self.assertEqual(service._decode((['r'], ['Int32'], ['3'])), 3)
+        self.assertEqual(service._decode((['r', 's'], ['Int32', 'String'], ['3', 'x'])), {'r': 3, 's': 'x'})
+
+        @services.returns((int, str))
+        def pair(a):
+            pass
+
+        service = services.published('url', 'key', None, pair, None)
+        self.assertEqual(service._decode((['r', 's'], ['Int32', 'String'], ['3', '4'])), (3, '4'))
+
+    def test_invoke_errors(self):
+        import json
+
+        class Response(object):
+            def __init__(self, status_code, text):
+                self.status_code = status_code
+                self.text = text
+                self.headers = {}
+
+            def json(self):
+                return json.loads(self.text)
+
+        class Session(object):
+            def post(self, url, **kwargs):
+                return responses.pop(0)
+
+        def f(a):
+            pass
+
+        service = services.published('url', 'key', None, f, None)
+        service._session = Session()
+        failed = json.dumps({'error': {'code': 'ModuleExecutionError', 'details': [{'message': 'failed'}]}})
+        responses = [Response(500, failed), Response(503, 'busy'), Response(400, '{}')]
+
+        with self.assertRaises(RuntimeError) as context:
+            service._invoke([[1]])
+        self.assertEqual(str(context.exception), 'failed')
+        self.assertRaises(services._TransientServiceError, service._invoke, [[1]])
+        self.assertRaises(ValueError, service._invoke, [[1]])
+
+    def test_send_batch_retry_policy(self):
+        import json
+        from azureml.http import RetryPolicy
+
+        class Response(object):
+            def __init__(self, status_code, result):
+                self.status_code = status_code
+                self.text = json.dumps(result)
+                self.headers = {}
+
+            def json(self):
+                return json.loads(self.text)
+
+        class Session(object):
+            def post(self, url, **kwargs):
+                return responses.pop(0)
+
+        class NoRetryPolicy(RetryPolicy):
+            def is_retriable(self, error):
+                return False
+
+        def f(a):
+            pass
+
+        service = services.published('url', 'key', None, f, None)
+        service._session = Session()
+        service.retry_policy = RetryPolicy(backoff_factor=0)
+        output = {'Results': {'output1': {'value': {'ColumnNames': ['r'], 'ColumnTypes': ['Int32'], 'Values': [['3']]}}}}
+        responses = [Response(503, {}), Response(200, output)]
+
+        self.assertEqual(service._send_batch([[1]]), [(['r'], ['Int32'], ['3'])])
+
+        # the policy decides which service errors are retried
+        service.retry_policy = NoRetryPolicy()
+        responses = [Response(503, {}), Response(200, output)]
+        self.assertRaises(services._TransientServiceError, service._send_batch, [[1]])
+
+    def test_result_cache_path(self):
+        import os
+        import shutil
+        import tempfile
+        import time
+
+        path = tempfile.mkdtemp()
+        try:
+            first = services._ResultCache(path=path, url='first')
+            second = services._ResultCache(path=path, url='second')
+            first.put('[1]', 'a')
+            second.put('[1]', 'b')
+
+            # services sharing a directory neither see nor clear each other's results
+            self.assertEqual(services._ResultCache(path=path, url='first').get('[1]'), 'a')
+            first.clear()
+            self.assertIsNone(services._ResultCache(path=path, url='first').get('[1]'))
+            self.assertEqual(services._ResultCache(path=path, url='second').get('[1]'), 'b')
+
+            # an expired result file is removed when found
+            expiring = services._ResultCache(ttl=0, path=path, url='third')
+            expiring.put('[1]', 'c')
+            time.sleep(0.01)
+            self.assertIsNone(services._ResultCache(path=path, url='third').get('[1]'))
+            self.assertEqual(len(os.listdir(path)), 1)
+        finally:
+            shutil.rmtree(path)
+
+    def test_decode_frame(self):
+        try:
+            import numpy
+            import pandas
+        except ImportError:
+            return
+
+        columns = ['a', 'b', 'c', 'd']
+        types = ['Int32', 'Double', 'Boolean', 'String']
+        results = [
+            (columns, types, ['1', '2.5', 'True', 'x']),
+            (columns, types, ['3', 'NaN', 'False', 'y']),
+        ]
+
+        frame = _decode_frame(results, None)
+
+        self.assertEqual(list(frame.columns), columns)
+        self.assertEqual(frame['a'].dtype, numpy.int64)
+        self.assertEqual(frame['b'].dtype, numpy.float64)
+        self.assertEqual(frame['c'].dtype, numpy.bool_)
+        self.assertEqual(list(frame['a']), [1, 3])
+        self.assertEqual(list(frame['c']), [True, False])
+        self.assertEqual(list(frame['d']), ['x', 'y'])
+
     def test_reads_class(self):
         global reads_class, MyClass
 
@@ -42,12 +42,12 @@ def invoke(published_func, *args, **kwargs):
             traceback.print_exc()
             print(e)
     
-def invoke_map(published_func, *args):
+def invoke_map(published_func, *args, **kwargs):
     '''helper to repeatedly invoke the function until it becomes available...'''
     for i in xrange(100):
         time.sleep(5)
         try:
-            return published_func.map(*args)
+            return published_func.map(*args, **kwargs)
             break
         except Exception as e:
             traceback.print_exc()
@@ -77,6 +77,56 @@ class Test_services(unittest.TestCase):
         # invoking via map
         self.assertEqual(invoke_map(lib.typed.service, [1, 1], [2, 4]), [3, 5])
 
+    def test_map_as_frame(self):
+        # invoking via map, decoded into a DataFrame
+        frame = invoke_map(lib.typed.service, [1, 1], [2, 4], as_frame=True)
+        self.assertEqual(list(frame.iloc[:, 0]), [3, 5])
+
+    def test_map_batched(self):
+        # invoking via map, in batches sent concurrently
+        a = list(range(25))
+        b = list(range(100, 125))
+        self.assertEqual(
+            invoke_map(lib.typed.service, a, b, batch_size=4, max_concurrency=3),
+            [x + y for x, y in zip(a, b)])
+
+    def test_batched_calls(self):
+        # concurrent calls sent together
+        from multiprocessing.pool import ThreadPool
+        service = lib.typed.service
+        invoke(service, 1, 2)
+        service.enable_batching(max_rows=8, max_delay=0.05)
+        try:
+            pool = ThreadPool(16)
+            results = pool.map(lambda a: service(a, 100), range(32))
+            pool.close()
+        finally:
+            service.disable_batching()
+        self.assertEqual(results, [a + 100 for a in range(32)])
+
+    def test_cached(self):
+        # repeated calls answered by the cache
+        @services.service(lib.typed.service.url, lib.typed.service.api_key)
+        @services.cache(max_entries=10)
+        @services.types(a = int, b = int)
+        @services.returns(int)
+        def typed(a, b):
+            pass
+
+        self.assertEqual(invoke(typed, 1, 2), 3)
+        misses = typed.cache.misses
+        self.assertEqual(typed(1, 2), 3)
+        self.assertEqual(typed.map([1, 2], [2, 2]), [3, 4])
+        self.assertEqual(typed.cache.hits, 2)
+        self.assertEqual(typed.cache.misses, misses + 1)
+
+    def test_published_cached(self):
+        # a published function decorated with @services.cache runs on the server
+        self.assertEqual(invoke(lib.cached.service, 1, 2), 3)
+        hits = lib.cached.service.cache.hits
+        self.assertEqual(lib.cached.service(1, 2), 3)
+        self.assertEqual(lib.cached.service.cache.hits, hits + 1)
+
     def test_varargs(self):
         # style 1, var args
         self.assertEqual(invoke(lib.mysum.service, 1, 2, 3), 6)
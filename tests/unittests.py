@@ -23,6 +23,7 @@
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #--------------------------------------------------------------------------
 
+import json
 import math
 import sys
 import unittest
@@ -32,17 +33,34 @@ import numpy as np
 from os import path
 from pandas.util.testing import assert_frame_equal
 import random
+import requests
+from requests.packages.urllib3.exceptions import MaxRetryError, NewConnectionError
+import shutil
+import tempfile
 
 from azureml import (
     BytesIO,
+    DatasetCache,
     Workspace,
     DataTypeIds,
     AzureMLConflictHttpError,
+    AzureMLError,
     AzureMLHttpError,
+    AzureMLTransientHttpError,
+    RetryPolicy,
+    SourceDataset,
     UnsupportedDatasetTypeError,
+    _RestClient,
     serialize_dataframe,
     deserialize_dataframe,
 )
+from azureml import serialization
+from azureml.cache import _MetadataCache
+try:
+    from urlparse import parse_qs, urlparse
+except ImportError:
+    from urllib.parse import parse_qs, urlparse
+
 from tests import (
     id_generator,
     load_test_settings,
@@ -53,7 +71,7 @@ EXAMPLE_EXPERIMENT_ID = '506153734175476c4f62416c57734963.f-id.1f022fd4578847dc8
 EXAMPLE_EXPERIMENT_DESC = 'Binary Classification: Breast cancer detection'
 
 EXAMPLE_DATASET_NAME = 'Airport Codes Dataset'
-EXAMPLE_UNSUPPORTED_DATASET_NAME = 'Breast cancer data'
+EXAMPLE_ARFF_DATASET_NAME = 'Breast cancer data'
 
 settings = load_test_settings()
 
@@ -156,6 +174,21 @@ management_endpoint=management_endpoint
 
         # Assert
 
+    def test_context_manager(self):
+        # Arrange
+
+        # Act
+        with Workspace(
+            workspace_id=settings.workspace.id,
+            authorization_token=settings.workspace.token,
+            endpoint=settings.workspace.endpoint,
+            pool_maxsize=4,
+        ) as workspace:
+            result = len(workspace.datasets)
+
+        # Assert
+        self.assertGreater(result, 0)
+
 
 class ExperimentsTests(unittest.TestCase):
     def setUp(self):
@@ -271,6 +304,26 @@ class ExperimentsTests(unittest.TestCase):
 
         # Assert
 
+    def test_get_by_id(self):
+        # Arrange
+        id = settings.intermediateDataset.experiment_id
+
+        # Act
+        result = self.workspace.experiments.get_by_id(id)
+
+        # Assert
+        self.assertEqual(result.experiment_id, id)
+
+    def test_get_many(self):
+        # Arrange
+        id = settings.intermediateDataset.experiment_id
+
+        # Act
+        result = self.workspace.experiments.get_many([id, id])
+
+        # Assert
+        self.assertEqual([e.experiment_id for e in result], [id, id])
+
     def test_repr(self):
         # Arrange
 
@@ -501,6 +554,56 @@ class DatasetsTests(unittest.TestCase):
 
         # Assert
 
+    def test_get_many(self):
+        # Arrange
+        names = [EXAMPLE_DATASET_NAME, EXAMPLE_ARFF_DATASET_NAME]
+
+        # Act
+        result = self.workspace.example_datasets.get_many(names)
+
+        # Assert
+        self.assertEqual([d.name for d in result], names)
+
+    def test_get_many_does_not_exist(self):
+        # Arrange
+
+        # Act
+        with self.assertRaises(IndexError):
+            result = self.workspace.datasets.get_many([EXAMPLE_DATASET_NAME, 'Does Not Exist'])
+
+        # Assert
+
+    def test_get_many_by_id(self):
+        # Arrange
+        expected = list(self.workspace.example_datasets)[:3]
+
+        # Act
+        result = self.workspace.example_datasets.get_many_by_id(
+            [d.dataset_id for d in expected])
+
+        # Assert
+        self.assertEqual([d.name for d in result], [d.name for d in expected])
+
+    def test_get_by_id_does_not_exist(self):
+        # Arrange
+
+        # Act
+        with self.assertRaises(IndexError):
+            result = self.workspace.datasets.get_by_id('Does Not Exist')
+
+        # Assert
+
+    def test_find_by_data_type_id(self):
+        # Arrange
+
+        # Act
+        result = self.workspace.example_datasets.find(data_type_id=DataTypeIds.GenericCSV)
+
+        # Assert
+        self.assertGreater(len(result), 0)
+        self.assertTrue(all(d.data_type_id == DataTypeIds.GenericCSV for d in result))
+        self.assertTrue(all(d.is_example for d in result))
+
     def test_iter(self):
         # Arrange
 
@@ -595,6 +698,28 @@ class UploadTests(unittest.TestCase):
         self.assertEqual(result.owner, 'Python SDK')
         self.assertIsNotNone(self.workspace.datasets[self.original_name])
 
+    def test_add_from_dataframe_chunked(self):
+        # Arrange
+        dataframe = pd.DataFrame({
+            'a': range(0x40000),
+            'b': [random.random() for x in range(0x40000)],
+        })
+        writer = BytesIO()
+        serialize_dataframe(writer, DataTypeIds.GenericCSV, dataframe)
+
+        # Act
+        result = self.workspace.datasets.add_from_dataframe(
+            dataframe,
+            DataTypeIds.GenericCSV,
+            self.original_name,
+            self.original_description,
+            max_concurrency=2,
+        )
+
+        # Assert
+        self.assertGreater(len(writer.getvalue()), self.workspace._rest.CHUNK_SIZE)
+        self.assertEqual(result.read_as_binary(), writer.getvalue())
+
     def test_add_from_dataframe_conflict(self):
         # Arrange
         self.workspace.datasets.add_from_dataframe(
@@ -718,6 +843,108 @@ class UploadTests(unittest.TestCase):
         new_data = self.workspace.datasets[original_name].read_as_binary()
         self.assertEqual(original_raw_data, new_data)
 
+    def test_add_from_raw_data_chunked_concurrent(self):
+        original_name = 'unittestcsvwh' + id_generator()
+
+        # Arrange
+        original_raw_data = bytes(bytearray(random.randint(0, 255) for x in range(0x900000)))
+
+        # Act
+        result = self.workspace.datasets.add_from_raw_data(
+            original_raw_data,
+            DataTypeIds.GenericCSV,
+            original_name,
+            'test description',
+            max_concurrency=4,
+        )
+
+        # Assert
+        self.assertIsNotNone(result)
+        self.assertEqual(result.name, original_name)
+
+        new_data = self.workspace.datasets[original_name].read_as_binary()
+        self.assertEqual(original_raw_data, new_data)
+
+    def test_add_from_raw_data_buffer(self):
+        original_name = 'unittestcsvwh' + id_generator()
+
+        # Arrange
+        original_raw_data = bytearray(random.randint(0, 255) for x in range(0x500000))
+
+        # Act
+        result = self.workspace.datasets.add_from_raw_data(
+            memoryview(original_raw_data),
+            DataTypeIds.GenericCSV,
+            original_name,
+            'test description',
+            max_concurrency=2,
+        )
+
+        # Assert
+        new_data = self.workspace.datasets[original_name].read_as_binary()
+        self.assertEqual(bytes(original_raw_data), new_data)
+
+    def test_add_from_file(self):
+        # Arrange
+        original_raw_data = _frame_to_raw_data(self.original_dataframe, ',', True)
+        file_path = path.join(path.dirname(__file__), self.original_name + '.csv')
+        with open(file_path, 'wb') as data_file:
+            data_file.write(original_raw_data.encode('utf-8'))
+
+        # Act
+        try:
+            result = self.workspace.datasets.add_from_file(
+                file_path,
+                DataTypeIds.GenericCSV,
+                self.original_name,
+                self.original_description,
+            )
+        finally:
+            os.unlink(file_path)
+
+        # Assert
+        self.assertIsNotNone(result)
+        self.assertEqual(result.name, self.original_name)
+        assert_frame_equal(result.to_dataframe(), self.original_dataframe)
+
+    def test_add_from_stream(self):
+        # Arrange
+        original_raw_data = bytes(bytearray(random.randint(0, 255) for x in range(0x300000)))
+        stream = (original_raw_data[i:i + 1000] for i in range(0, len(original_raw_data), 1000))
+
+        # Act
+        result = self.workspace.datasets.add_from_stream(
+            stream,
+            DataTypeIds.GenericCSV,
+            self.original_name,
+            self.original_description,
+            size=len(original_raw_data),
+        )
+
+        # Assert
+        self.assertIsNotNone(result)
+        self.assertEqual(result.name, self.original_name)
+        self.assertEqual(result.read_as_binary(), original_raw_data)
+
+    def test_add_from_raw_data_journal(self):
+        # Arrange
+        original_raw_data = bytes(bytearray(random.randint(0, 255) for x in range(0x300000)))
+        journal_path = path.join(path.dirname(__file__), self.original_name + '.journal')
+
+        # Act
+        result = self.workspace.datasets.add_from_raw_data(
+            original_raw_data,
+            DataTypeIds.GenericCSV,
+            self.original_name,
+            self.original_description,
+            journal_path=journal_path,
+        )
+
+        # Assert
+        self.assertIsNotNone(result)
+        self.assertFalse(path.exists(journal_path))
+        self.assertEqual(result.read_as_binary(), original_raw_data)
+
 
     def test_update_from_raw_data(self):
         # Arrange
@@ -888,9 +1115,47 @@ class DatasetTests(unittest.TestCase):
             result.values[-1],
             [14543, 'Rock Springs', 'WY', 'Rock Springs Sweetwater County'])
 
+    def test_to_dataframe_chunksize(self):
+        # Arrange
+        dataset = self.workspace.datasets[EXAMPLE_DATASET_NAME]
+        expected = dataset.to_dataframe()
+
+        # Act
+        result = list(dataset.to_dataframe(chunksize=100))
+
+        # Assert
+        self.assertTrue(all(len(chunk) <= 100 for chunk in result))
+        assert_frame_equal(expected, pd.concat(result))
+
+    def test_to_dataframe_columns_dtypes(self):
+        # Arrange
+        dataset = self.workspace.datasets[EXAMPLE_DATASET_NAME]
+
+        # Act
+        result = dataset.to_dataframe(
+            columns=['state', 'airport_id'], dtypes={'state': 'category'})
+
+        # Assert
+        self.assertArrayEqual(result.columns, [u'state', u'airport_id'])
+        self.assertEqual(result['state'].dtype.name, 'category')
+
+    def test_to_dataframe_arff(self):
+        # Arrange
+        dataset = self.workspace.datasets[EXAMPLE_ARFF_DATASET_NAME]
+
+        # Act
+        result = dataset.to_dataframe()
+
+        # Assert
+        self.assertEqual(dataset.data_type_id, DataTypeIds.ARFF)
+        self.assertGreater(len(result.columns), 0)
+        self.assertGreater(len(result), 0)
+
     def test_to_dataframe_unsupported_data_type_id(self):
         # Arrange
-        dataset = self.workspace.datasets[EXAMPLE_UNSUPPORTED_DATASET_NAME]
+        example = self.workspace.datasets[EXAMPLE_DATASET_NAME]
+        metadata = dict(example._metadata, DataTypeId='Unsupported')
+        dataset = SourceDataset(self.workspace, metadata)
 
         # Act
         result = hasattr(dataset, 'to_dataframe')
@@ -922,6 +1187,50 @@ class DatasetTests(unittest.TestCase):
         expected = b'airport_id,city,state,name\r\n10165,Adak Island, AK, Adak'
         self.assertEqual(result[:len(expected)], expected)
 
+    def test_read_as_binary_parallel_ranges(self):
+        # Arrange
+        dataset = self.workspace.datasets[EXAMPLE_DATASET_NAME]
+        expected = dataset.read_as_binary(max_connections=1)
+        threshold = _RestClient.PARALLEL_DOWNLOAD_THRESHOLD
+        range_size = _RestClient.DOWNLOAD_RANGE_SIZE
+
+        # Act
+        try:
+            _RestClient.PARALLEL_DOWNLOAD_THRESHOLD = 0
+            _RestClient.DOWNLOAD_RANGE_SIZE = 0x1000
+            result = dataset.read_as_binary(max_connections=4)
+        finally:
+            _RestClient.PARALLEL_DOWNLOAD_THRESHOLD = threshold
+            _RestClient.DOWNLOAD_RANGE_SIZE = range_size
+
+        # Assert
+        self.assertEqual(result, expected)
+
+    def test_read_as_binary_cached(self):
+        # Arrange
+        directory = tempfile.mkdtemp()
+        cache = DatasetCache(directory)
+        workspace = Workspace(
+            workspace_id=settings.workspace.id,
+            authorization_token=settings.workspace.token,
+            endpoint=settings.workspace.endpoint,
+            cache=cache,
+        )
+        dataset = workspace.datasets[EXAMPLE_DATASET_NAME]
+
+        # Act
+        try:
+            first = dataset.read_as_binary()
+            second = dataset.read_as_binary()
+        finally:
+            workspace.close()
+            shutil.rmtree(directory)
+
+        # Assert
+        self.assertEqual(first, second)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+
     def test_read_as_text(self):
         # Arrange
         dataset = self.workspace.datasets[EXAMPLE_DATASET_NAME]
@@ -936,6 +1245,323 @@ class DatasetTests(unittest.TestCase):
         self.assertEqual(lines[-1], '14543,Rock Springs, WY, Rock Springs Sweetwater County')
 
 
+class MetadataCacheTests(unittest.TestCase):
+    def test_get_reuses_listing_until_invalidated(self):
+        # Arrange
+        requests = []
+        cache = _MetadataCache(lambda: requests.append(1) or len(requests), None)
+
+        # Act
+        first = cache.get()
+        second = cache.get()
+        cache.invalidate()
+        third = cache.get()
+
+        # Assert
+        self.assertEqual([first, second, third], [1, 1, 2])
+
+    def test_get_with_zero_ttl_requests_every_time(self):
+        # Arrange
+        requests = []
+        cache = _MetadataCache(lambda: requests.append(1) or len(requests), 0)
+
+        # Act
+        result = [cache.get(), cache.get()]
+
+        # Assert
+        self.assertEqual(result, [1, 2])
+
+
+class DatasetCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_add_checks_size(self):
+        # Arrange
+        cache = DatasetCache(self.directory)
+
+        # Act
+        with cache.add('complete', BytesIO(b'0123'), 4) as cached:
+            result = cached.read()
+        with self.assertRaises(AzureMLError):
+            cache.add('truncated', BytesIO(b'01'), 4)
+
+        # Assert
+        self.assertEqual(result, b'0123')
+        self.assertIsNone(cache.open('truncated'))
+        self.assertEqual(os.listdir(self.directory),
+                         [path.basename(cache._get_path('complete'))])
+
+    def test_zero_max_size(self):
+        # Arrange
+        cache = DatasetCache(self.directory, max_size=0)
+
+        # Act
+        cache.add('first', BytesIO(b'0123')).close()
+        cache.add('second', BytesIO(b'4567')).close()
+
+        # Assert
+        self.assertEqual(cache.max_size, 0)
+        self.assertIsNone(cache.open('first'))
+        self.assertEqual(cache.evictions, 1)
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def test_execute_retries_transient_errors(self):
+        # Arrange
+        policy = RetryPolicy(backoff_factor=0.001)
+        errors = [AzureMLHttpError('unavailable', 503), AzureMLHttpError('timeout', 504)]
+
+        def request():
+            if errors:
+                raise errors.pop(0)
+            return 'result'
+
+        # Act
+        result = policy.execute(request)
+
+        # Assert
+        self.assertEqual(result, 'result')
+        self.assertEqual(errors, [])
+
+    def test_execute_does_not_retry_client_errors(self):
+        # Arrange
+        policy = RetryPolicy(backoff_factor=0.001)
+        attempts = []
+
+        def request():
+            attempts.append(1)
+            raise AzureMLHttpError('bad request', 400)
+
+        # Act
+        with self.assertRaises(AzureMLHttpError):
+            policy.execute(request)
+
+        # Assert
+        self.assertEqual(len(attempts), 1)
+
+    def test_execute_stops_after_max_attempts(self):
+        # Arrange
+        policy = RetryPolicy(max_attempts=3, backoff_factor=0.001)
+        attempts = []
+
+        def request():
+            attempts.append(1)
+            raise AzureMLHttpError('unavailable', 503)
+
+        # Act
+        with self.assertRaises(AzureMLTransientHttpError):
+            policy.execute(request)
+
+        # Assert
+        self.assertEqual(len(attempts), 3)
+
+    def test_execute_unsafe_retries_only_unsent_requests(self):
+        # Arrange
+        policy = RetryPolicy(backoff_factor=0.001)
+        unsent = requests.ConnectionError(
+            MaxRetryError(None, '/', NewConnectionError(None, 'refused')))
+        errors = [unsent, requests.ConnectTimeout(), AzureMLHttpError('unavailable', 503)]
+
+        def request():
+            raise errors.pop(0)
+
+        # Act
+        with self.assertRaises(AzureMLTransientHttpError):
+            policy.execute_unsafe(request)
+
+        # Assert
+        self.assertEqual(errors, [])
+
+    def test_get_backoff_honors_retry_after(self):
+        # Arrange
+        policy = RetryPolicy(backoff_factor=1, max_backoff=8, jitter=False)
+        error = AzureMLHttpError('throttled', 429)
+
+        # Act
+        backoffs = [policy.get_backoff(attempt, error) for attempt in range(1, 6)]
+        error.retry_after = 20
+        retry_after = policy.get_backoff(1, error)
+
+        # Assert
+        self.assertEqual(backoffs, [1, 2, 4, 8, 8])
+        self.assertEqual(retry_after, 20)
+
+
+class _FakeResponse(object):
+    def __init__(self, status_code, result):
+        self.status_code = status_code
+        self.headers = {}
+        self.text = json.dumps(result)
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class _FakeSession(object):
+    """
+    Stands in for the requests session of a _RestClient, recording the
+    upload requests and answering them like the REST API.
+    """
+
+    def __init__(self):
+        self.upload_ids = []
+        self.blocks = []
+        self.errors = {}
+        self.timeouts = set()
+
+    def request(self, method, url, **kwargs):
+        self.timeouts.add(kwargs.get('timeout'))
+        url = urlparse(url)
+        query = dict((key, values[0]) for key, values in parse_qs(url.query).items())
+        if '/resourceuploads/' in url.path:
+            if 'resourceuploads' in self.errors:
+                return _FakeResponse(self.errors.pop('resourceuploads'), {})
+            self.upload_ids.append('upload{0}'.format(len(self.upload_ids)))
+            return _FakeResponse(200, {'Id': self.upload_ids[-1]})
+        if '/blobuploads/' in url.path:
+            key = (query['uploadId'], int(query['blockId']))
+            if key in self.errors:
+                return _FakeResponse(self.errors.pop(key), {})
+            body = kwargs['data']
+            self.blocks.append(key + (body.read() if hasattr(body, 'read') else bytes(body),))
+            return _FakeResponse(200, {})
+        return _FakeResponse(200, 'dataset-id')
+
+    def close(self):
+        pass
+
+
+class OfflineUploadTests(unittest.TestCase):
+    def setUp(self):
+        self.rest = _RestClient('http://localhost/', 'token',
+                                retry_policy=RetryPolicy(max_attempts=1))
+        self.rest.CHUNK_SIZE = 4
+        self.session = self.rest._session = _FakeSession()
+        self.temp_dir = tempfile.mkdtemp()
+        self.journal_path = path.join(self.temp_dir, 'upload.journal')
+        self.raw_data = b'0123456789abcdefghij'
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def upload(self):
+        return self.rest.upload_dataset(
+            'workspace', 'name', 'description', DataTypeIds.GenericCSV,
+            self.raw_data, None, journal_path=self.journal_path)
+
+    def test_upload_resumes_missing_blocks(self):
+        # Arrange
+        self.session.errors[('upload0', 3)] = 400
+        with self.assertRaises(AzureMLHttpError):
+            self.upload()
+        del self.session.blocks[:]
+
+        # Act
+        result = self.upload()
+
+        # Assert
+        self.assertEqual(result, 'dataset-id')
+        self.assertEqual(self.session.upload_ids, ['upload0'])
+        self.assertEqual(self.session.blocks, [
+            ('upload0', 0, b'0123'),
+            ('upload0', 3, b'cdef'),
+            ('upload0', 4, b'ghij'),
+        ])
+        self.assertFalse(path.exists(self.journal_path))
+
+    def test_upload_resume_reads_one_block_before_probing(self):
+        # Arrange
+        self.session.errors[('upload0', 3)] = 400
+        with self.assertRaises(AzureMLHttpError):
+            self.upload()
+        read = []
+        def stream():
+            for start in range(0, len(self.raw_data), 4):
+                read.append(start)
+                yield self.raw_data[start:start + 4]
+        send_block = self.rest._send_block
+        probed = []
+        def record_send_block(*args):
+            probed.append(len(read))
+            return send_block(*args)
+        self.rest._send_block = record_send_block
+
+        # Act
+        result = self.rest.upload_dataset_from_stream(
+            'workspace', 'name', 'description', DataTypeIds.GenericCSV,
+            stream(), len(self.raw_data), None, journal_path=self.journal_path)
+
+        # Assert
+        self.assertEqual(result, 'dataset-id')
+        self.assertEqual(probed[0], 1)
+        self.assertEqual(len(read), 5)
+
+    def test_upload_restarts_when_journaled_upload_is_rejected(self):
+        # Arrange
+        self.session.errors[('upload0', 3)] = 500
+        with self.assertRaises(AzureMLHttpError):
+            self.upload()
+        self.session.errors[('upload0', 0)] = 404
+        del self.session.blocks[:]
+
+        # Act
+        result = self.upload()
+
+        # Assert
+        self.assertEqual(result, 'dataset-id')
+        self.assertEqual(self.session.upload_ids, ['upload0', 'upload1'])
+        self.assertEqual([block[:2] for block in self.session.blocks],
+                         [('upload1', block_id) for block_id in range(5)])
+        self.assertEqual(b''.join(block[2] for block in self.session.blocks),
+                         self.raw_data)
+        self.assertFalse(path.exists(self.journal_path))
+
+
+    def test_upload_str(self):
+        # Arrange
+        self.raw_data = u'a,b\n\u00e9,1\n'
+
+        # Act
+        result = self.upload()
+
+        # Assert
+        self.assertEqual(result, 'dataset-id')
+        self.assertEqual(b''.join(block[2] for block in self.session.blocks),
+                         self.raw_data.encode('utf-8'))
+
+    def test_upload_non_contiguous_buffer(self):
+        # Arrange
+        self.raw_data = np.arange(12, dtype=np.int16)[::2]
+
+        # Act
+        result = self.upload()
+
+        # Assert
+        self.assertEqual(result, 'dataset-id')
+        self.assertEqual(b''.join(block[2] for block in self.session.blocks),
+                         self.raw_data.tobytes())
+
+    def test_upload_retries_blocks_but_not_creation(self):
+        # Arrange
+        self.rest._retry_policy = RetryPolicy(backoff_factor=0)
+        self.session.errors['resourceuploads'] = 503
+
+        # Act
+        with self.assertRaises(AzureMLTransientHttpError):
+            self.upload()
+        self.session.errors[('upload0', 2)] = 503
+        result = self.upload()
+
+        # Assert
+        self.assertEqual(result, 'dataset-id')
+        self.assertEqual([block[1] for block in self.session.blocks], [0, 1, 2, 3, 4])
+        self.assertEqual(self.session.timeouts, set([_RestClient.DEFAULT_TIMEOUT]))
+
+
 class SerializationTests(unittest.TestCase):
     def assertArrayEqual(self, a, b):
         if sys.version_info < (3,):
@@ -1013,6 +1639,18 @@ class SerializationTests(unittest.TestCase):
         self.assertGreater(len(result), 0)
         self.assertEqual(result, b'This is the first\nThis is second line\n')
 
+    def test_serialize_to_plain_text_multiple_columns(self):
+        # Arrange
+        dataframe = pd.DataFrame({'a': [u'caf\xe9 ', u''], 'b': [u'au lait', u'th\xe9']})
+
+        # Act
+        writer = BytesIO()
+        serialize_dataframe(writer, DataTypeIds.PlainText, dataframe)
+        result = writer.getvalue()
+
+        # Assert
+        self.assertEqual(result, u'caf\xe9 au lait\nth\xe9\n'.encode('utf-8'))
+
     def test_deserialize_from_plain_text_bom(self):
         # Arrange
         data = b'\xef\xbb\xbfJohn enjoyed his vacation in California. His personal favorite on the trip was Los Angeles.\r\nMicrosoft announced upgrades to their line of products for information workers. The announcement was made at a partner conference at Boston.'
@@ -1029,6 +1667,127 @@ class SerializationTests(unittest.TestCase):
         ]
         assert_frame_equal(pd.DataFrame(expected), result)
 
+    def test_deserialize_from_plain_text_line_breaks(self):
+        # Arrange
+        data = b'first\r\nsecond\n\nthird\rfourth'
+
+        # Act
+        reader = BytesIO(data)
+        result = deserialize_dataframe(reader, DataTypeIds.PlainText)
+
+        # Assert
+        expected = pd.DataFrame({0: ['first', 'second', 'third', 'fourth']})
+        assert_frame_equal(expected, result)
+
+    def test_serialize_to_csv_max_workers(self):
+        # Arrange
+        dataframe = pd.DataFrame({
+            'a': range(25),
+            'b': [u'x, "\u00e9"' if i % 3 else None for i in range(25)],
+            'c': [i / 7.0 for i in range(25)],
+            'd': [pd.Timestamp('2020-01-01') + pd.Timedelta(days=i, hours=i // 20) for i in range(25)],
+            'e': [pd.Timedelta(days=i) if i % 5 else None for i in range(25)],
+        })
+        block_rows = serialization._PARALLEL_BLOCK_ROWS
+        serialization._PARALLEL_BLOCK_ROWS = 4
+
+        # Act
+        try:
+            results = []
+            for data_type_id in [DataTypeIds.GenericCSV, DataTypeIds.GenericTSVNoHeader]:
+                writer = BytesIO()
+                serialize_dataframe(writer, data_type_id, dataframe, max_workers=2)
+                results.append(writer.getvalue())
+        finally:
+            serialization._PARALLEL_BLOCK_ROWS = block_rows
+
+        # Assert
+        for data_type_id, result in zip([DataTypeIds.GenericCSV, DataTypeIds.GenericTSVNoHeader], results):
+            writer = BytesIO()
+            serialize_dataframe(writer, data_type_id, dataframe)
+            self.assertEqual(writer.getvalue(), result)
+        self.assertIn(b'\n0,,0.0,2020-01-01 00:00:00,\n', results[0])
+
+    def test_deserialize_from_csv_chunksize(self):
+        # Arrange
+        data = b'a,b\n1,2\n3,4\n5,6\n'
+
+        # Act
+        reader = BytesIO(data)
+        result = list(deserialize_dataframe(reader, DataTypeIds.GenericCSV, chunksize=2))
+
+        # Assert
+        self.assertEqual([len(chunk) for chunk in result], [2, 1])
+        assert_frame_equal(pd.DataFrame({'a': [1, 3, 5], 'b': [2, 4, 6]}), pd.concat(result))
+
+    def test_deserialize_from_csv_columns_dtypes(self):
+        # Arrange
+        data = b'a,b,c\n1,x,2.5\n3,y,4.5\n'
+
+        # Act
+        reader = BytesIO(data)
+        result = deserialize_dataframe(
+            reader, DataTypeIds.GenericCSV, columns=['c', 'a'], dtypes={'a': 'int32'})
+
+        # Assert
+        expected = pd.DataFrame({'c': [2.5, 4.5], 'a': np.array([1, 3], dtype='int32')})
+        assert_frame_equal(expected, result)
+
+    def test_deserialize_from_csv_parallel_engine(self):
+        # Arrange
+        data = (b'\xef\xbb\xbfa, b,c\n' +
+                b''.join(b'%d, "x,\n""%d""",%d\n' % (i, i, i) for i in range(50)) +
+                b'50, y,\n51, z,2.5\n')
+        block_size = serialization._PARALLEL_BLOCK_SIZE
+        cpu_count = serialization.cpu_count
+        serialization._PARALLEL_BLOCK_SIZE = 64
+        serialization.cpu_count = lambda: 4
+
+        # Act
+        try:
+            result = deserialize_dataframe(BytesIO(data), DataTypeIds.GenericCSV, engine='parallel')
+            no_header = deserialize_dataframe(BytesIO(data), DataTypeIds.GenericCSVNoHeader, engine='parallel')
+        finally:
+            serialization._PARALLEL_BLOCK_SIZE = block_size
+            serialization.cpu_count = cpu_count
+
+        # Assert
+        assert_frame_equal(deserialize_dataframe(BytesIO(data), DataTypeIds.GenericCSV), result)
+        assert_frame_equal(deserialize_dataframe(BytesIO(data), DataTypeIds.GenericCSVNoHeader), no_header)
+        self.assertEqual(result['b'][3], 'x,\n"3"')
+
+    def test_deserialize_from_csv_parallel_engine_unquoted_quote(self):
+        # Arrange
+        data = (b'id,size,note\n2,5" disk,plain\n' +
+                b''.join(b'%d,1,"multi\nline %d"\n' % (i, i) for i in range(20)))
+        block_size = serialization._PARALLEL_BLOCK_SIZE
+        cpu_count = serialization.cpu_count
+        serialization._PARALLEL_BLOCK_SIZE = 64
+        serialization.cpu_count = lambda: 4
+
+        # Act
+        try:
+            result = deserialize_dataframe(BytesIO(data), DataTypeIds.GenericCSV, engine='parallel')
+        finally:
+            serialization._PARALLEL_BLOCK_SIZE = block_size
+            serialization.cpu_count = cpu_count
+
+        # Assert
+        assert_frame_equal(deserialize_dataframe(BytesIO(data), DataTypeIds.GenericCSV), result)
+        self.assertEqual(result['size'][0], '5" disk')
+
+    def test_deserialize_from_plain_text_chunksize(self):
+        # Arrange
+        data = b'first\nsecond\nthird\n'
+
+        # Act
+        reader = BytesIO(data)
+        result = list(deserialize_dataframe(reader, DataTypeIds.PlainText, chunksize=2))
+
+        # Assert
+        self.assertEqual([len(chunk) for chunk in result], [2, 1])
+        assert_frame_equal(pd.DataFrame({0: ['first', 'second', 'third']}), pd.concat(result))
+
     def test_deserialize_from_csv(self):
         # Arrange
         data = b'a,b,c\n1.0,2.0,nan\n5.1,10.1,20.1\n50.2,,50.3\n'
@@ -1097,7 +1856,6 @@ class SerializationTests(unittest.TestCase):
         ]
         assert_frame_equal(pd.DataFrame(expected), result)
 
-    @unittest.skip('ARFF is not supported yet.')
     def test_deserialize_from_arff(self):
         # Arrange
         data = b"""@RELATION	Unnamed
@@ -1128,6 +1886,120 @@ class SerializationTests(unittest.TestCase):
         ]
         assert_frame_equal(pd.DataFrame(expected), result)
 
+    def test_deserialize_from_arff_nominal_string(self):
+        # Arrange
+        data = b"""@RELATION	Unnamed
+
+@ATTRIBUTE	'tumor size'	{small,'very big'}
+@ATTRIBUTE	note	STRING
+
+@DATA
+small,'it\\'s, ok'
+'very big',?
+"""
+
+        # Act
+        reader = BytesIO(data)
+        result = deserialize_dataframe(reader, DataTypeIds.ARFF)
+
+        # Assert
+        self.assertEqual(list(result.columns), ['tumor size', 'note'])
+        self.assertEqual(list(result['tumor size'].cat.categories), ['small', 'very big'])
+        self.assertEqual(list(result['tumor size']), ['small', 'very big'])
+        self.assertEqual(result['note'][0], "it's, ok")
+        self.assertTrue(pd.isnull(result['note'][1]))
+
+    def test_deserialize_from_arff_double_quotes(self):
+        # Arrange
+        data = b"""@RELATION	Unnamed
+
+@ATTRIBUTE	note	STRING
+@ATTRIBUTE	size	{small,'very big'}
+@ATTRIBUTE	date	DATE "yyyy-MM-dd"
+
+@DATA
+"hello, world",small,"2020-01-02"
+"say \\"hi\\", it's", "very big", 2021-03-04
+'a,"b"',small,?
+"""
+
+        # Act
+        reader = BytesIO(data)
+        result = deserialize_dataframe(reader, DataTypeIds.ARFF)
+
+        # Assert
+        self.assertEqual(list(result['note']), ['hello, world', 'say "hi", it\'s', 'a,"b"'])
+        self.assertEqual(list(result['size']), ['small', 'very big', 'small'])
+        self.assertEqual(result['date'][0], pd.Timestamp('2020-01-02'))
+        self.assertEqual(result['date'][1], pd.Timestamp('2021-03-04'))
+        self.assertTrue(pd.isnull(result['date'][2]))
+
+    def test_deserialize_from_arff_comments(self):
+        # Arrange
+        data = b"""@RELATION	Unnamed
+
+@ATTRIBUTE	x	NUMERIC
+
+@DATA
+% comment line
+1
+  % indented comment line
+2
+"""
+
+        # Act
+        reader = BytesIO(data)
+        result = deserialize_dataframe(reader, DataTypeIds.ARFF)
+
+        # Assert
+        self.assertEqual(list(result['x']), [1., 2.])
+
+    def test_arff_round_trip_question_marks(self):
+        # Arrange
+        dataframe = pd.DataFrame({
+            'note': ['?', None, '??', ''],
+            'size': pd.Categorical(['?', 'small', None, 'small']),
+        })
+
+        # Act
+        writer = BytesIO()
+        serialize_dataframe(writer, DataTypeIds.ARFF, dataframe)
+        result = deserialize_dataframe(BytesIO(writer.getvalue()), DataTypeIds.ARFF)
+
+        # Assert
+        self.assertEqual(result['note'][0], '?')
+        self.assertTrue(pd.isnull(result['note'][1]))
+        self.assertEqual(result['note'][2], '??')
+        self.assertEqual(result['note'][3], '')
+        self.assertEqual(list(result['size'].cat.categories), ['?', 'small'])
+        self.assertEqual(result['size'][0], '?')
+        self.assertTrue(pd.isnull(result['size'][2]))
+
+    def test_serialize_to_arff(self):
+        # Arrange
+        dataframe = pd.DataFrame({
+            'size': pd.Categorical(['small', 'very big']),
+            'note': ["it's, ok", None],
+            'value': [1.5, 2.0],
+        })
+
+        # Act
+        writer = BytesIO()
+        serialize_dataframe(writer, DataTypeIds.ARFF, dataframe)
+        result = writer.getvalue()
+
+        # Assert
+        self.assertEqual(result, b"""@RELATION	Unnamed
+
+@ATTRIBUTE	size	{small,'very big'}
+@ATTRIBUTE	note	STRING
+@ATTRIBUTE	value	NUMERIC
+
+@DATA
+small,'it\\'s, ok',1.5
+'very big',?,2.0
+""")
+
     def test_deserialize_from_unsupported_data_type_id(self):
         # Arrange
         data = b'1.0,2.0,nan\n5.1,10.1,20.1\n50.2,,50.3\n'